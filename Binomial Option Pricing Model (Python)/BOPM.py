@@ -1,93 +1,12 @@
+import math
 import numpy as np
 
-def exercise_val(underlying : float, 
-                 strike : float, 
-                 otype : str, 
-                 up : float, 
-                 numUp : int, 
-                 numDown : int) -> float:
-    '''
-    
-    Calculates the exercise value of an option at expiration.
-
-
-    Parameters
-    ----------
-    `underlying` : float
-        The price of the underlying at time 0.
-    
-    `strike` : float
-        The strike price of the option.
-
-    `otype` : str
-        The type of option: ["put", "call"]
-    
-    `up` : float
-        The expected amount of volatiilty over a single period.
-    
-    `numUp` : int
-        The number of periods with positive volatility moves.
-
-    `numDown` : int
-        The number of periods with negative volatility moves.
-    
-        
-    Returns
-    -------
-    `float`
-        The value of the option at expiration.
-    
-    '''
-    
-    if otype == "call":
-        price = underlying * up**(numUp - numDown) - strike
-
-    elif otype == "put":
-        price = strike - underlying * up**(numUp - numDown)
+try:
+    from numba import njit
+    NUMBA = True
 
-    if price < 0:
-        price = 0
-
-    return price
-
-def binom_val(nextUpNode : float, 
-              nextDownNode : float, 
-              probUp : float, 
-              discount : float) -> float:
-    '''
-    
-    Calculates the binomial value of an option.
-
-
-    Parameters
-    ----------
-    `nextUpNode` : float
-        The value of the next period's option if a positive volatility move
-        occurs.
-    
-    `nextDownNode` : float
-        The value of the next period's option if a negative volatility move
-        occurs.
-    
-    `probUp` : float
-        The probability of a positive volatility move occuring.
-    
-    `discount` : float
-        The discount factor to apply to the expected value of the binomial option.
-    
-    Returns
-    -------
-    `float`
-        The binomial value of the option.
-
-    '''
-
-    price = (probUp * nextUpNode + (1 - probUp) * nextDownNode) * discount
-
-    if price < 0:
-        price = 0
-
-    return price
+except ImportError:
+    NUMBA = False
 
 def build_final_nodes(numIncrements : int, 
                       underlying : float, 
@@ -118,70 +37,95 @@ def build_final_nodes(numIncrements : int,
 
     Returns
     -------
-    `list`
-        A list of decending node values, with each node representing a
+    `np.ndarray`
+        An array of decending node values, with each node representing a
         potential final value of the option being priced.
 
     '''
 
-    numNodes = numIncrements + 1
-    nodes = []
+    # terminal prices run from up**N down to up**-N in steps of two
+    exponents = np.arange(numIncrements, -numIncrements - 1, -2)
+    factors = up**exponents
 
-    for node in range(0, numNodes):
-        numUp = numNodes - node
-        numDown = node
-        nodes.append(exercise_val(underlying, strike, otype, up, numUp, numDown))
+    if otype == "call":
+        intrinsic = underlying * factors - strike
 
-    return nodes
+    else:
+        intrinsic = strike - underlying * factors
 
-def recurse_trees(nodes : list, 
-                  up : float, 
-                  probUp : float, 
-                  discount : float) -> list:
+    return np.maximum(intrinsic, 0.0)
+
+def _bopm_kernel(numIncrements : int,
+                 underlying : float,
+                 strike : float,
+                 up : float,
+                 probUpDisc : float,
+                 probDownDisc : float,
+                 isCall : bool) -> float:
     '''
-    
-    Recursively builds trees within the binomial option pricing matrix.
+
+    Backward-induction kernel for binomial option pricing, written as plain
+    scalar loops so numba can compile it to a single tight LLVM loop (no
+    temporary arrays, no ufunc dispatch). Falls back to pure Python when
+    numba isn't installed.
 
 
     Parameters
     ----------
-    `nodes` : list
-        The final tree of nodes for the binimial model, created with
-        "build_final_nodes()".
+    `numIncrements` : int
+        The number of trees to build for the binomial model.
+
+    `underlying` : float
+        The price of the underlying at time 0.
+
+    `strike` : float
+        The strike price of the option.
 
     `up` : float
         The expected amount of volatiilty over a single period.
 
-    `probUp` : float
-        The probability of a positive volatility move occuring.
-    
-    `discount` : float
-        The discount factor to apply to the expected value of the binomial 
-        options.
+    `probUpDisc` : float
+        The probability of a positive volatility move occuring, pre-scaled
+        by the discount factor.
+
+    `probDownDisc` : float
+        The probability of a negative volatility move occuring, pre-scaled
+        by the discount factor.
+
+    `isCall` : bool
+        Whether the option being priced is a call.
 
     Returns
     -------
-    `list`
-        A list of all binomial option trees, with the final option price
-        at the very last index: [final nodes -> single node]
+    `float`
+        The modeled price of the option at time 0.
 
     '''
 
-    if not isinstance(nodes[0], list):
-        nodes = [nodes]
+    values = np.empty(numIncrements + 1)
+
+    # terminal payoffs, up**k built by repeated multiplication (no pow calls)
+    factor = up**numIncrements
+    ratio = 1.0 / (up * up)
 
-    if len(nodes[-1]) == 1:
-        return nodes
+    for node in range(numIncrements + 1):
+        if isCall:
+            payoff = underlying * factor - strike
+        else:
+            payoff = strike - underlying * factor
 
-    newNodes = []
+        values[node] = payoff if payoff > 0.0 else 0.0
+        factor *= ratio
 
-    for i in range(1, len(nodes[-1])):
-        binom = binom_val(nodes[-1][i-1], nodes[-1][i], probUp, discount)
-        newNodes.append(binom)
+    # backward sweep, one fused multiply-add per node
+    for i in range(numIncrements, 0, -1):
+        for j in range(i):
+            values[j] = probUpDisc * values[j] + probDownDisc * values[j+1]
 
-    nodes.append(newNodes)
+    return values[0]
 
-    return recurse_trees(nodes, up, probUp, discount)
+if NUMBA:
+    _bopm_kernel = njit(cache=True, fastmath=True)(_bopm_kernel)
 
 def BOPM(vol : float, 
          incrementTenor : float, 
@@ -190,7 +134,7 @@ def BOPM(vol : float,
          underlyingPrice : float, 
          strike : float, 
          otype : str, 
-         numIncrements : int) -> list:
+         numIncrements : int) -> float:
     '''
     
     Prices a European option via the Binomial Option Pricing Model.
@@ -223,30 +167,49 @@ def BOPM(vol : float,
 
     Returns
     -------
-    `list`
-        A list of all binomial option trees, with the final option price
-        at the very first index: [single node -> final nodes]
-    
+    `float`
+        The modeled price of the option at time 0.
+
     '''
 
     # continuously compounded interest rate equivalent
-    ccr = 360 * np.log(1 + rf / 360)
-    
+    ccr = 360 * math.log1p(rf / 360)
+
     # discount factor
-    discount = np.exp((-ccr) * discountTenor)
+    discount = math.exp((-ccr) * discountTenor)
 
     # binomial values
     a = 1
-    up = np.exp(vol * np.sqrt(incrementTenor))
-    b = np.sqrt(a**2 * (np.exp(vol**2 * incrementTenor) - 1))
-    up = ((a**2 + b**2 + 1) + np.sqrt((a**2 + b**2 + 1)**2 - 4 * a**2)) / (2 * a)
+    up = math.exp(vol * math.sqrt(incrementTenor))
+    b = math.sqrt(a**2 * (math.exp(vol**2 * incrementTenor) - 1))
+    up = ((a**2 + b**2 + 1) + math.sqrt((a**2 + b**2 + 1)**2 - 4 * a**2)) / (2 * a)
     down = 1/up
     probUp = (a - down) / (up - down)
-    
-    # model
-    nodes = build_final_nodes(numIncrements, underlyingPrice, strike, up, otype)
-    forest = recurse_trees(nodes, up, probUp, discount)
-    forest.reverse()
 
-    return forest
+    # fold the discount into the branch probabilities once, leaving one
+    # fused multiply-add per node in the sweep
+    probUpDisc = probUp * discount
+    probDownDisc = discount - probUpDisc
+
+    # model - jitted scalar kernel when numba's available (no per-level
+    # dispatch overhead, big win for small / medium increment counts)
+    if NUMBA:
+        return _bopm_kernel(numIncrements, underlyingPrice, strike, up,
+                            probUpDisc, probDownDisc, otype == "call")
+
+    # model - backward induction over a single price vector, shrinking one
+    # node per increment (only the current level is ever needed)
+    values = build_final_nodes(numIncrements, underlyingPrice, strike, up, otype)
+
+    # one persistent scratch buffer keeps the sweep allocation-free: the
+    # shifted down-move term lands in scratch, the up-move term multiplies
+    # in place (aligned, so no overlap hazard), then the two are summed
+    scratch = np.empty_like(values)
+
+    for i in range(numIncrements, 0, -1):
+        np.multiply(values[1:i+1], probDownDisc, out=scratch[:i])
+        np.multiply(values[:i], probUpDisc, out=values[:i])
+        values[:i] += scratch[:i]
+
+    return float(values[0])
 
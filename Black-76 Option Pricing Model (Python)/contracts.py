@@ -1,17 +1,40 @@
 from __future__ import annotations
 import abc
-import copy
 import datetime
+import math
+import time
 from typing import Any
 import numpy as np
-from types import NoneType, SimpleNamespace
-import scipy.stats
+from types import SimpleNamespace
 import scipy.optimize
+from scipy.special import ndtr
 import asyncio
+
+try:
+    from numba import njit, prange
+    NUMBA = True
+
+except ImportError:
+    NUMBA = False
+
+try:
+    from py_lets_be_rational import implied_volatility_from_a_transformed_rational_guess as _lbr
+    LBR = True
+
+except ImportError:
+    LBR = False
+
 import sys
 sys.path.append("<path here>")
 import daycount
 
+# inlined standard normal PDF - scipy.stats.norm.pdf dispatches through the
+# frozen-distribution machinery per call, this is just the closed form
+_INV_SQRT_2PI = 0.3989422804014327
+
+def _npdf(x : float) -> float:
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
 
 ''' BASE '''
 class BaseInstrument(abc.ABC):
@@ -51,7 +74,7 @@ class BaseInstrument(abc.ABC):
         The instrument's spread
 
     `isSnapshot` : bool
-        Whether the object is a snapshot (deepcopy) of another instrument.
+        Whether the object is a snapshot (static clone) of another instrument.
         
     Methods
     -------
@@ -62,16 +85,29 @@ class BaseInstrument(abc.ABC):
         Attaches a stream to continuously update the instrument's quotes.
     
     `snapshot()` -> object
-        Returns a deepcopy ("snapshot") of the instrument. The snapshot 
+        Returns a static clone ("snapshot") of the instrument. The snapshot 
         is  disconnected from any streamed content the original instrument was 
         connected to - ie. all snapshot variables are static until manually 
         changed.
     
     '''
 
-    def __init__(self, 
-                 tsym : str | None = None, 
-                 qsym : str | None = None, 
+    __slots__ = ("_bid", "_ask", "mark", "spread", "tsym", "qsym",
+                 "underlying", "derivatives", "_now", "isSnapshot", "_dirty")
+
+    # shared batching state - while a batch is open, notifications queue
+    # dirty instruments instead of repricing them immediately
+    _batching = False
+    _dirtyQueue = []
+
+    # shared live-clock cache - "now" reads within the same millisecond
+    # reuse one datetime instead of a syscall + allocation per read
+    _liveClockNs = 0
+    _liveClockDt = None
+
+    def __init__(self,
+                 tsym : str | None = None,
+                 qsym : str | None = None,
                  underlying : object | None = None) -> None:
         '''
 
@@ -106,12 +142,13 @@ class BaseInstrument(abc.ABC):
         self.underlying = underlying
         self.derivatives = []
         
-        if not isinstance(underlying, NoneType):
+        if underlying is not None:
             underlying.derivatives.append(self)
 
         self.now = None
-        
+
         self.isSnapshot = False
+        self._dirty = False
 
         return None
 
@@ -123,25 +160,25 @@ class BaseInstrument(abc.ABC):
     def bid(self, bid) -> None:
         
         # null init
-        if isinstance(bid, NoneType):
+        if bid is None:
             self._bid = None
 
         # set bid
-        elif isinstance(bid, (float, int)):
+        else:
+
+            # unchanged, skip the recompute and derivative cascade
+            if bid == self._bid:
+                return None
+
             self._bid = bid
 
             # mark and spread
-            if isinstance(self.ask, (float, int)):
+            if self.ask is not None:
                 self.mark = (self.bid + self.ask) / 2
                 self.spread = self.ask - self.bid
 
-            # update model
-            self._update()
-
-            # alert deriviatives
-            if len(self.derivatives) != 0:
-                for derivatives in self.derivatives:
-                    derivatives._update()
+            # update model and alert derivatives
+            self._notify()
 
         return None
 
@@ -153,34 +190,42 @@ class BaseInstrument(abc.ABC):
     def ask(self, ask) -> None:
 
         # null init
-        if isinstance(ask, NoneType):
+        if ask is None:
             self._ask = None
 
         # set ask
-        elif isinstance(ask, (float, int)):
+        else:
+
+            # unchanged, skip the recompute and derivative cascade
+            if ask == self._ask:
+                return None
+
             self._ask = ask
-            
+
             # mark and spread
-            if isinstance(self.bid, (float, int)):
+            if self.bid is not None:
                 self.mark = (self.bid + self.ask) / 2
                 self.spread = self.ask - self.bid
 
-            # update model
-            self._update()
-
-            # alert deriviatives
-            if len(self.derivatives) != 0:
-                for derivatives in self.derivatives:
-                    derivatives._update()
+            # update model and alert derivatives
+            self._notify()
 
         return None
 
     @property
     def now(self) -> datetime.datetime:
 
-        if isinstance(self._now, NoneType):
-            return datetime.datetime.now(tz=datetime.UTC)
-        
+        if self._now is None:
+
+            # refresh the shared cache at most once per millisecond
+            ns = time.monotonic_ns()
+
+            if ns - BaseInstrument._liveClockNs >= 1_000_000 or BaseInstrument._liveClockDt is None:
+                BaseInstrument._liveClockDt = datetime.datetime.now(tz=datetime.UTC)
+                BaseInstrument._liveClockNs = ns
+
+            return BaseInstrument._liveClockDt
+
         else:
             return self._now
         
@@ -188,17 +233,18 @@ class BaseInstrument(abc.ABC):
     def now(self, now : datetime.datetime | None) -> None:
 
         # if already present, update all
-        if "_now" in self.__dir__():
+        if hasattr(self, "_now"):
             # set new time
             self._now = now
 
-            # update model
-            self._update()
+            # tenors depend on the clock, refresh cached values first
+            self._recompute_tenor()
 
-            # alert derivatives
-            if len(self.derivatives) != 0:
-                for derivative in self.derivatives:
-                    derivative._update()
+            for derivative in self.derivatives:
+                derivative._recompute_tenor()
+
+            # update model and alert derivatives
+            self._notify()
 
         # else on init, skip update
         else:
@@ -206,9 +252,134 @@ class BaseInstrument(abc.ABC):
 
         return None
 
+    def _recompute_tenor(self) -> None:
+        '''
+
+        Refreshes any cached daycount tenors. No-op for instruments without
+        a settlement / expiration date; overridden where applicable.
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        return None
+
+    def _notify(self) -> None:
+        '''
+
+        Updates the instrument's modeled attributes, then those of any
+        derivatives based off of it. An empty derivatives list falls straight
+        through the loop, no length check needed.
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        # inside a batch, queue once instead of repricing immediately
+        if BaseInstrument._batching:
+            self._mark_dirty()
+
+            for derivative in self.derivatives:
+                derivative._mark_dirty()
+
+            return None
+
+        self._update()
+
+        for derivative in self.derivatives:
+            derivative._update()
+
+        return None
+
+    def _mark_dirty(self) -> None:
+        '''
+
+        Queues the instrument for a single deferred "_update()" at the end
+        of the enclosing batch. Repeated marks are coalesced.
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        if not self._dirty:
+            self._dirty = True
+            BaseInstrument._dirtyQueue.append(self)
+
+        return None
+
+    def batch(self) -> object:
+        '''
+
+        Returns a context manager that coalesces derivative notifications:
+        inside the "with" block setters only mark instruments dirty, and on
+        exit each dirty instrument is repriced exactly once, in the order
+        it was first touched (underlyings before their derivatives).
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `object`
+            The batching context manager.
+
+        '''
+
+        return _UpdateBatch()
+
+    @classmethod
+    def flush_updates(cls) -> None:
+        '''
+
+        Runs "_update()" once on every instrument queued while batching,
+        clearing the queue.
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        queue = cls._dirtyQueue
+        cls._dirtyQueue = []
+
+        for instrument in queue:
+            instrument._dirty = False
+            instrument._update()
+
+        return None
+
     def quote(self, bid : float | int, ask : float | int) -> None:
         '''
-        
+
         Simultaneously sets the instrument's bid and ask.
 
 
@@ -226,26 +397,25 @@ class BaseInstrument(abc.ABC):
         
         '''
 
+        # unchanged on both sides, nothing would move downstream
+        if bid == self._bid and ask == self._ask:
+            return None
+
         # set values WITHOUT "setter", avoid double alerting derivatives
         self._bid = bid
         self._ask = ask
 
         # mark and spread
-        if isinstance(self.bid, (float, int)) and isinstance(self.ask, (float, int)):
+        if self.bid is not None and self.ask is not None:
             self.mark = (self.bid + self.ask) / 2
             self.spread = self.ask - self.bid
         
-        elif isinstance(self.bid, NoneType) or isinstance(self.ask, NoneType):
+        else:
             self.mark = None
             self.spread = None
 
-        # update model
-        self._update()
-
-        # alert derivatives
-        if len(self.derivatives) != 0:
-            for derivative in self.derivatives:
-                derivative._update()
+        # update model and alert derivatives
+        self._notify()
 
         return None
 
@@ -282,26 +452,27 @@ class BaseInstrument(abc.ABC):
             quotes = stream.quote(self.qsym)
 
             # if new bid, record
-            if isinstance(quotes["bidPrice"], (float, int)) and (isinstance(self._bid, NoneType) or (quotes["bidPrice"] != self.bid)):
+            if quotes["bidPrice"] is not None and (self._bid is None or (quotes["bidPrice"] != self.bid)):
                 newBid = quotes["bidPrice"]
             else:
                 newBid = None
 
             # if new ask, record
-            if isinstance(quotes["askPrice"], (float, int)) and (isinstance(self._ask, NoneType) or (quotes["askPrice"] != self.ask)):
+            if quotes["askPrice"] is not None and (self._ask is None or (quotes["askPrice"] != self.ask)):
                 newAsk = quotes["askPrice"]
             else:
                 newAsk = None
 
-            # set new quotes
-            if isinstance(newBid, (float, int)) and isinstance(newAsk, (float, int)):
-                self.quote(newBid, newAsk)
-            
-            elif isinstance(newBid, (float, int)):
-                self.bid = newBid
-            
-            elif isinstance(newAsk, (float, int)):
-                self.ask = newAsk
+            # set new quotes, coalesced so the model re-solves once per tick
+            with self.batch():
+                if newBid is not None and newAsk is not None:
+                    self.quote(newBid, newAsk)
+
+                elif newBid is not None:
+                    self.bid = newBid
+
+                elif newAsk is not None:
+                    self.ask = newAsk
 
             # wait for next poll
             await asyncio.sleep(poll)
@@ -335,10 +506,119 @@ class BaseInstrument(abc.ABC):
 
         return None
 
+    @classmethod
+    async def _attach_stream_batch(cls, instruments : list, stream : object,
+                                   poll : int) -> None:
+        '''
+
+        Wrapper for "attach_stream_batch()", asynchronously updates all
+        instruments' quotes with one batched stream read per poll.
+
+
+        Parameters
+        ----------
+        `instruments` : list
+            The instruments sharing the stream.
+
+        `stream` : object
+            The stream receiving live quotes, supporting "quote_batch()".
+
+        `poll` : int
+            The number of seconds between polling for new quotes.
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        # symbol -> instrument dispatch index, built once
+        bySym = {instrument.qsym : instrument for instrument in instruments}
+
+        # endlessly check for updates
+        while stream.isAlive and len(bySym) != 0:
+
+            # asyncio nuance
+            await asyncio.sleep(0)
+
+            # pull every symbol's quotes in one batch call
+            quotes = stream.quote_batch(list(bySym))
+
+            for qsym, quote in quotes.items():
+
+                instrument = bySym[qsym]
+
+                # snapshots are static, stop updating them
+                if instrument.isSnapshot:
+                    del bySym[qsym]
+                    continue
+
+                # if new bid, record
+                if quote["bidPrice"] is not None and (instrument._bid is None or (quote["bidPrice"] != instrument.bid)):
+                    newBid = quote["bidPrice"]
+                else:
+                    newBid = None
+
+                # if new ask, record
+                if quote["askPrice"] is not None and (instrument._ask is None or (quote["askPrice"] != instrument.ask)):
+                    newAsk = quote["askPrice"]
+                else:
+                    newAsk = None
+
+                # set new quotes, coalesced so models re-solve once per tick
+                with _UpdateBatch():
+                    if newBid is not None and newAsk is not None:
+                        instrument.quote(newBid, newAsk)
+
+                    elif newBid is not None:
+                        instrument.bid = newBid
+
+                    elif newAsk is not None:
+                        instrument.ask = newAsk
+
+            # wait for next poll
+            await asyncio.sleep(poll)
+
+        return None
+
+    @classmethod
+    def attach_stream_batch(cls, instruments : list, stream : object,
+                            poll : int = 1) -> None:
+        '''
+
+        Attaches a single poller updating every instrument on the stream -
+        one batched quote read and one dispatch pass per poll, instead of a
+        polling coroutine (and a dict lookup cascade) per instrument.
+
+
+        Parameters
+        ----------
+        `instruments` : list
+            The instruments sharing the stream.
+
+        `stream` : object
+            The stream receiving live quotes. The stream object must contain
+            a "self._link._loop" attribute representing the "asyncio" loop
+            managing the stream, and support "quote_batch()".
+
+        `poll` : int = 1
+            The number of seconds between polling for new quotes.
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        # continuously updates quotes in the background
+        asyncio.run_coroutine_threadsafe(cls._attach_stream_batch(instruments, stream, poll), stream._link._loop)
+
+        return None
+
     def snapshot(self) -> object:
         '''
         
-        Returns a deepcopy ("snapshot") of the instrument. The snapshot 
+        Returns a static clone ("snapshot") of the instrument. The snapshot 
         is  disconnected from any streamed content the original instrument was 
         connected to - ie. all snapshot variables are static until manually 
         changed.
@@ -355,21 +635,66 @@ class BaseInstrument(abc.ABC):
         
         '''
 
-        # snapshot
-        snapshot = copy.deepcopy(self)
-        
-        # disable updates to stream
+        # snapshot, disable updates to stream
+        snapshot = self._clone()
         snapshot.isSnapshot = True
-        
-        # disable updates to underlying / derivatives
-        if not isinstance(snapshot.underlying, NoneType):
-            snapshot.underlying.isSnapshot = True
-        
-        for deriv in snapshot.derivatives:
-            deriv.isSnapshot = True
+        snapshot.derivatives = []
+
+        # freeze the underlying too, without touching the live instrument
+        if self.underlying is not None:
+            underlying = self.underlying._clone()
+            underlying.isSnapshot = True
+            underlying.derivatives = []
+            snapshot.underlying = underlying
 
         return snapshot
 
+    def _clone(self) -> object:
+        '''
+
+        Returns a bare attribute-for-attribute copy of the instrument, built
+        by copying each slot onto a fresh instance (no deepcopy graph walk).
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `object`
+            A shallow clone of the instrument.
+
+        '''
+
+        cls = type(self)
+        clone = object.__new__(cls)
+
+        for klass in cls.__mro__:
+            for slot in getattr(klass, "__slots__", ()):
+
+                # pre-bound methods are re-bound below, not copied
+                if slot == "_update":
+                    continue
+
+                # unset slots stay unset on the clone
+                try:
+                    setattr(clone, slot, getattr(self, slot))
+                except AttributeError:
+                    pass
+
+        # the pre-bound update must target the clone, not the source
+        if hasattr(cls, "_update_model"):
+            clone._update = clone._update_model
+        else:
+            clone._update = _noop_update
+
+        # modeled prices live in a mutable namespace, don't share it
+        if isinstance(getattr(clone, "price", None), SimpleNamespace):
+            clone.price = SimpleNamespace(**vars(clone.price))
+
+        return clone
+
     @abc.abstractmethod
     def _update(self) -> None:
         '''
@@ -390,6 +715,34 @@ class BaseInstrument(abc.ABC):
         return None
 
 
+def _noop_update() -> None:
+    '''
+
+    Shared no-op "_update" for instruments without a model of their own.
+
+    '''
+
+    return None
+
+
+class _UpdateBatch:
+    '''
+
+    Context manager backing "BaseInstrument.batch()". Opens shared batching
+    on entry and flushes the dirty queue on exit.
+
+    '''
+
+    def __enter__(self) -> object:
+        BaseInstrument._batching = True
+        return self
+
+    def __exit__(self, excType, excValue, traceback) -> bool:
+        BaseInstrument._batching = False
+        BaseInstrument.flush_updates()
+        return False
+
+
 ''' SPOT '''
 class FXSpot(BaseInstrument):
     '''
@@ -428,7 +781,7 @@ class FXSpot(BaseInstrument):
         The instrument's spread
 
     `isSnapshot` : bool
-        Whether the object is a snapshot (deepcopy) of another instrument.
+        Whether the object is a snapshot (static clone) of another instrument.
         
     Methods
     -------
@@ -439,16 +792,18 @@ class FXSpot(BaseInstrument):
         Attaches a stream to continuously update the instrument's quotes.
     
     `snapshot()` -> object
-        Returns a deepcopy ("snapshot") of the instrument. The snapshot 
+        Returns a static clone ("snapshot") of the instrument. The snapshot 
         is  disconnected from any streamed content the original instrument was 
         connected to - ie. all snapshot variables are static until manually 
         changed.
     
     '''
 
+    __slots__ = ("_update",)
+
     def __init__(self, **kwargs) -> None:
         '''
-        
+
         Initializes the FXSpot object.
 
 
@@ -473,16 +828,11 @@ class FXSpot(BaseInstrument):
         # inherit children
         super().__init__(**kwargs)
 
-        return None
-
-    def _update(self) -> None:
-        '''
-        
-        Overrides abstract method. Method not applicable to FXSpot class.
+        # pre-bind the (no-op) hot update path onto the instance so the
+        # derivative fan-out skips the MRO walk per call
+        self._update = _noop_update
 
-        '''
-
-        pass
+        return None
 
 
 ''' FUTURES '''
@@ -565,7 +915,7 @@ class CurrencyFuture(BaseInstrument):
         The instrument's spread
 
     `isSnapshot` : bool
-        Whether the object is a snapshot (deepcopy) of another instrument.
+        Whether the object is a snapshot (static clone) of another instrument.
         
     Methods
     -------
@@ -576,17 +926,20 @@ class CurrencyFuture(BaseInstrument):
         Attaches a stream to continuously update the instrument's quotes.
     
     `snapshot()` -> object
-        Returns a deepcopy ("snapshot") of the instrument. The snapshot 
+        Returns a static clone ("snapshot") of the instrument. The snapshot 
         is  disconnected from any streamed content the original instrument was 
         connected to - ie. all snapshot variables are static until manually 
         changed.
     
     '''
 
-    def __init__(self, 
+    __slots__ = ("_rf", "ccr", "_qf", "ccq", "settle", "carry", "price",
+                 "_r_tenor", "_update")
+
+    def __init__(self,
                  rf : float,
-                 qf : float, 
-                 settle : datetime.datetime, 
+                 qf : float,
+                 settle : datetime.datetime,
                  **kwargs) -> None:
         '''
         
@@ -623,6 +976,10 @@ class CurrencyFuture(BaseInstrument):
         # inherit children
         super().__init__(**kwargs)
 
+        # pre-bind the hot update path onto the instance (skips the MRO walk
+        # on every derivative notification)
+        self._update = self._update_model
+
         # initialize variables
         self.rf = None
         self.ccr = None
@@ -634,6 +991,7 @@ class CurrencyFuture(BaseInstrument):
         # set variables
         self.price = SimpleNamespace(bid=None, ask=None, mark=None, spread=None)
         self.settle = settle
+        self._recompute_tenor()
         self.rf = rf    # sets self.ccr internally
         self.qf = qf    # sets self.ccq internally
 
@@ -646,23 +1004,18 @@ class CurrencyFuture(BaseInstrument):
     @rf.setter
     def rf(self, rf : float) -> None:
         
-        if isinstance(rf, NoneType):
+        if rf is None:
             self._rf = None
             self.ccr = None
 
-        elif isinstance(rf, (float, int)):
+        else:
             
             # convert to continuously compounded
             self._rf = rf
-            self.ccr = 360 * np.log(1 + self.rf / 360)
+            self.ccr = 360 * math.log1p(self.rf / 360)
             
-            # update model
-            self._update()
-
-            # update derivatives
-            if len(self.derivatives) != 0:
-                for derivative in self.derivatives:
-                    derivative._update()
+            # update model and alert derivatives
+            self._notify()
 
         return None
     
@@ -673,34 +1026,56 @@ class CurrencyFuture(BaseInstrument):
     @qf.setter
     def qf(self, qf : float) -> None:
         
-        if isinstance(qf, NoneType):
+        if qf is None:
             self._qf = None
             self.ccq = None
 
-        elif isinstance(qf, (float, int)):
+        else:
 
             # convert to continuously compounded
             self._qf = qf
-            self.ccq = 360 * np.log(1 + self.qf / 360)
+            self.ccq = 360 * math.log1p(self.qf / 360)
 
-            # update model
-            self._update()
-
-            # update derivatives
-            if len(self.derivatives) != 0:
-                for derivative in self.derivatives:
-                    derivative._update()
+            # update model and alert derivatives
+            self._notify()
 
         return None
 
     @property
     def r_tenor(self) -> float:
-        return daycount.actual360_T(self.now, self.settle)
 
-    def _update(self) -> None:
+        # live clock, recompute on every access
+        if self._now is None:
+            return daycount.actual360_T(self.now, self.settle)
+
+        # backtest clock, cached until "now" / "settle" changes
+        return self._r_tenor
+
+    def _recompute_tenor(self) -> None:
         '''
-        
-        Overrides abstract method. Updates the currency future's modeled price,
+
+        Overrides base method. Refreshes the cached settlement tenor so
+        price updates don't redo datetime arithmetic per tick.
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        self._r_tenor = daycount.actual360_T(self.now, self.settle)
+
+        return None
+
+    def _update_model(self) -> None:
+        '''
+
+        Implements the abstract "_update()". Updates the currency future's modeled price,
         calculates the market's modeled estimate of the currency pair's 
         cost-of-carry (annualized).
 
@@ -721,37 +1096,307 @@ class CurrencyFuture(BaseInstrument):
 
         else:
             # ensure underlying available
-            if not isinstance(self.underlying, NoneType):
-            
+            if self.underlying is not None:
+
+                # one tenor read, one exponential for both sides
+                r_tenor = self.r_tenor
+                forward = math.exp((self.ccr - self.ccq) * r_tenor)
+
                 # model bid
-                if isinstance(self.underlying.bid, (float, int)):
-                    self.price.bid = self.underlying.bid * np.exp((self.ccr - self.ccq)*self.r_tenor)
+                if self.underlying.bid is not None:
+                    self.price.bid = self.underlying.bid * forward
 
                 # model ask
-                if isinstance(self.underlying.ask, (float, int)):
-                    self.price.ask = self.underlying.ask * np.exp((self.ccr - self.ccq)*self.r_tenor)
+                if self.underlying.ask is not None:
+                    self.price.ask = self.underlying.ask * forward
 
                 # calculate mark & spread
-                if isinstance(self.price.bid, (float, int)) and isinstance(self.price.ask, (float, int)):
+                if self.price.bid is not None and self.price.ask is not None:
                     self.price.mark = (self.price.bid + self.price.ask) / 2
-                    self.price.spread = self.price.ask - self.price.bid    
+                    self.price.spread = self.price.ask - self.price.bid
 
                 # calculate cost-of-carry
-                if isinstance(self.underlying.mark, (float, int)) and isinstance(self.mark, (float, int)):
+                if self.underlying.mark is not None and self.mark is not None:
                     # continuously compounded cost-of-carry
-                    ccc = np.log(self.mark / self.underlying.mark) / self.r_tenor
-                    
+                    ccc = math.log(self.mark / self.underlying.mark) / r_tenor
+
                     # annualized cost-of-carry
-                    self.carry = (np.exp(ccc / 360) - 1) * 360                
+                    self.carry = math.expm1(ccc / 360) * 360
 
         return None
 
 
 ''' OPTIONS '''
+def price_chain_black76(f_mark : float,
+                        strikes : np.ndarray,
+                        t_tenors : np.ndarray,
+                        r_tenors : np.ndarray,
+                        ccr : float,
+                        vols : np.ndarray,
+                        isCall : np.ndarray) -> dict:
+    '''
+
+    Prices an entire option chain (and its greeks) in one vectorized
+    Black-76 pass - each transcendental is evaluated once per array rather
+    than once per contract, turning N scalar scipy round-trips into a
+    handful of ufunc calls.
+
+
+    Parameters
+    ----------
+    `f_mark` : float
+        The underlying future's mark.
+
+    `strikes` : np.ndarray
+        The strike price of each option.
+
+    `t_tenors` : np.ndarray
+        The trading-daycount tenor of each option.
+
+    `r_tenors` : np.ndarray
+        The interest-rate-daycount tenor of each option.
+
+    `ccr` : float
+        The continuously compounded domestic risk-free rate.
+
+    `vols` : np.ndarray
+        The implied volatility of each option.
+
+    `isCall` : np.ndarray
+        Whether each option is a call.
+
+    Returns
+    -------
+    `dict`
+        Arrays keyed: ["price", "delta", "gamma", "vega", "theta", "rho"]
+
+    '''
+
+    # jitted kernel when numba's available - one compiled pass over the
+    # chain, multithreaded across cores with SIMD inside each thread
+    if NUMBA:
+        out = _black76_chain_kernel(f_mark, strikes, t_tenors, r_tenors, ccr,
+                                    vols, isCall.astype(np.int64),
+                                    1 / daycount.trading_days())
+
+        return {"price" : out[..., 0], "delta" : out[..., 1],
+                "gamma" : out[..., 2], "vega" : out[..., 3],
+                "theta" : out[..., 4], "rho" : out[..., 5]}
+
+    # Black-76 Variables, whole-chain arrays
+    discount = np.exp((-ccr) * r_tenors)
+    sqrt_t = np.sqrt(t_tenors)
+    d_plus = (np.log(f_mark / strikes) + (vols*vols / 2) * t_tenors) / (vols * sqrt_t)
+    d_minus = d_plus - vols * sqrt_t
+
+    cdf_plus = ndtr(d_plus)
+    cdf_minus = ndtr(d_minus)
+    pdf_plus = np.exp(-0.5 * d_plus * d_plus) * _INV_SQRT_2PI
+
+    dailyTheta = 1 / daycount.trading_days()
+
+    # Black-76 Option Pricing Model (OPM) and greeks, calls and puts folded
+    # together via np.where (ndtr(-x) == 1 - ndtr(x))
+    price = np.where(isCall,
+                     discount * (f_mark * cdf_plus - strikes * cdf_minus),
+                     discount * (strikes * (1.0 - cdf_minus) - f_mark * (1.0 - cdf_plus)))
+
+    delta = np.where(isCall, discount * cdf_plus, discount * (cdf_plus - 1.0))
+
+    one = (f_mark * pdf_plus * vols * discount) / (2.0 * sqrt_t)
+    two = ccr * f_mark * discount * np.where(isCall, cdf_plus, 1.0 - cdf_plus)
+    three = ccr * strikes * discount * np.where(isCall, cdf_minus, 1.0 - cdf_minus)
+    theta = np.where(isCall, (-one) + two - three, (-one) - two + three) * dailyTheta
+
+    rho = np.where(isCall,
+                   strikes * r_tenors * discount * cdf_minus,
+                   (-strikes) * r_tenors * discount * (1.0 - cdf_minus))
+
+    gamma = (pdf_plus * discount) / (f_mark * vols * sqrt_t)
+    vega = f_mark * sqrt_t * pdf_plus * discount
+
+    return {"price" : price, "delta" : delta, "gamma" : gamma,
+            "vega" : vega, "theta" : theta, "rho" : rho}
+
+if NUMBA:
+    def _black76_chain_kernel(f_mark : float, strikes : np.ndarray,
+                              t_tenors : np.ndarray, r_tenors : np.ndarray,
+                              ccr : float, vols : np.ndarray,
+                              isCall : np.ndarray,
+                              dailyTheta : float) -> np.ndarray:
+
+        out = np.empty((strikes.shape[0], 6))
+
+        for i in prange(strikes.shape[0]):
+            strike = strikes[i]
+            vol = vols[i]
+
+            # Black-76 Variables
+            discount = math.exp((-ccr) * r_tenors[i])
+            sqrt_t = math.sqrt(t_tenors[i])
+            d_plus = (math.log(f_mark / strike) + (vol*vol / 2.0) * t_tenors[i]) / (vol * sqrt_t)
+            d_minus = d_plus - vol * sqrt_t
+
+            # standard normal CDF / PDF inlined via erf (numba-friendly)
+            cdf_plus = 0.5 * (1.0 + math.erf(d_plus / 1.4142135623730951))
+            cdf_minus = 0.5 * (1.0 + math.erf(d_minus / 1.4142135623730951))
+            pdf_plus = math.exp(-0.5 * d_plus * d_plus) * 0.3989422804014327
+
+            # Black-76 Option Pricing Model (OPM) and greeks
+            one = (f_mark * pdf_plus * vol * discount) / (2.0 * sqrt_t)
+
+            if isCall[i]:
+                out[i, 0] = discount * (f_mark * cdf_plus - strike * cdf_minus)
+                out[i, 1] = discount * cdf_plus
+
+                two = ccr * f_mark * cdf_plus * discount
+                three = ccr * strike * discount * cdf_minus
+                out[i, 4] = ( (-one) + two - three ) * dailyTheta  # daily theta
+
+                out[i, 5] = strike * r_tenors[i] * discount * cdf_minus
+
+            else:
+                out[i, 0] = discount * (strike * (1.0 - cdf_minus) - f_mark * (1.0 - cdf_plus))
+                out[i, 1] = discount * (cdf_plus - 1.0)
+
+                two = ccr * f_mark * (1.0 - cdf_plus) * discount
+                three = ccr * strike * discount * (1.0 - cdf_minus)
+                out[i, 4] = ( (-one) - two + three ) * dailyTheta  # daily theta
+
+                out[i, 5] = (-strike) * r_tenors[i] * discount * (1.0 - cdf_minus)
+
+            # call / put symmetric greeks
+            out[i, 2] = (pdf_plus * discount) / (f_mark * vol * sqrt_t)
+            out[i, 3] = f_mark * sqrt_t * pdf_plus * discount
+
+        return out
+
+    _black76_chain_kernel = njit(cache=True, fastmath=True, parallel=True)(_black76_chain_kernel)
+
+def _black76_residual(vol : float, realPrice : float, isCall : int,
+                      discount : float, log_fk : float, sqrt_t : float,
+                      t_tenor : float, f_mark : float, strike : float) -> float:
+
+    # Black-76 Variables - discount, log(F/K), and sqrt(t) don't depend on
+    # vol, so they arrive precomputed rather than being redone per iteration
+    d_plus = (log_fk + (vol*vol / 2.0) * t_tenor) / (vol * sqrt_t)
+    d_minus = d_plus - vol * sqrt_t
+
+    # standard normal CDF inlined via erf (numba-friendly, no scipy inside
+    # the kernel)
+    cdf_plus = 0.5 * (1.0 + math.erf(d_plus / 1.4142135623730951))
+    cdf_minus = 0.5 * (1.0 + math.erf(d_minus / 1.4142135623730951))
+
+    # Black-76 Option Pricing Model (OPM)
+    if isCall:
+        estPrice = discount * (f_mark * cdf_plus - strike * cdf_minus)
+
+    else:
+        estPrice = discount * (strike * (1.0 - cdf_minus) - f_mark * (1.0 - cdf_plus))
+
+    return estPrice - realPrice
+
+if NUMBA:
+    _black76_residual = njit(cache=True, fastmath=True)(_black76_residual)
+
+def _black76_implied_newton(vol : float, realPrice : float, isCall : int,
+                            discount : float, log_fk : float, sqrt_t : float,
+                            t_tenor : float, f_mark : float,
+                            strike : float) -> float:
+
+    # hand-rolled Newton-Raphson - scipy.optimize.newton pays per-iteration
+    # Python overhead re-packing args and calling back into the residual,
+    # and the residual doesn't expose its vega. Computing price and vega
+    # together off one d_plus makes each step a handful of scalar ops, and
+    # the whole loop jit-compiles when numba's around
+    for _ in range(16):
+        d_plus = (log_fk + (vol*vol / 2.0) * t_tenor) / (vol * sqrt_t)
+        d_minus = d_plus - vol * sqrt_t
+
+        cdf_plus = 0.5 * (1.0 + math.erf(d_plus / 1.4142135623730951))
+        cdf_minus = 0.5 * (1.0 + math.erf(d_minus / 1.4142135623730951))
+        pdf_plus = math.exp(-0.5 * d_plus * d_plus) * 0.3989422804014327
+
+        if isCall:
+            estPrice = discount * (f_mark * cdf_plus - strike * cdf_minus)
+
+        else:
+            estPrice = discount * (strike * (1.0 - cdf_minus) - f_mark * (1.0 - cdf_plus))
+
+        vega = f_mark * sqrt_t * pdf_plus * discount
+
+        dv = (estPrice - realPrice) / vega
+        vol -= dv
+
+        if abs(dv) < 1e-8:
+            break
+
+    return vol
+
+if NUMBA:
+    _black76_implied_newton = njit(cache=True, fastmath=True)(_black76_implied_newton)
+
+def _black76_kernel(f_mark : float, strike : float, t_tenor : float,
+                    r_tenor : float, ccr : float, ccq : float, vol : float,
+                    isCall : int, dailyTheta : float) -> tuple:
+
+    # Black-76 Variables, computed once and shared by price and greeks
+    discount = math.exp((-ccr) * r_tenor)
+    sqrt_t = math.sqrt(t_tenor)
+    d_plus = (math.log(f_mark / strike) + (vol*vol / 2.0) * t_tenor) / (vol * sqrt_t)
+    d_minus = d_plus - vol * sqrt_t
+
+    # standard normal CDF / PDF inlined via erf (numba-friendly, no scipy
+    # inside the kernel)
+    cdf_plus = 0.5 * (1.0 + math.erf(d_plus / 1.4142135623730951))
+    cdf_minus = 0.5 * (1.0 + math.erf(d_minus / 1.4142135623730951))
+    pdf_plus = math.exp(-0.5 * d_plus * d_plus) * 0.3989422804014327
+
+    epsDiscount = math.exp((-ccq) * r_tenor)
+
+    # Black-76 Option Pricing Model (OPM) and greeks
+    one = (f_mark * pdf_plus * vol * discount) / (2.0 * sqrt_t)
+
+    if isCall:
+        price = discount * (f_mark * cdf_plus - strike * cdf_minus)
+        delta = discount * cdf_plus
+
+        two = ccr * f_mark * cdf_plus * discount
+        three = ccr * strike * discount * cdf_minus
+        theta = ( (-one) + two - three ) * dailyTheta  # daily theta
+
+        rho = strike * r_tenor * discount * cdf_minus
+        epsilon = (-r_tenor) * f_mark * epsDiscount * cdf_plus
+
+    else:
+        price = discount * (strike * (1.0 - cdf_minus) - f_mark * (1.0 - cdf_plus))
+        delta = discount * (cdf_plus - 1.0)
+
+        two = ccr * f_mark * (1.0 - cdf_plus) * discount
+        three = ccr * strike * discount * (1.0 - cdf_minus)
+        theta = ( (-one) - two + three ) * dailyTheta  # daily theta
+
+        rho = (-strike) * r_tenor * discount * (1.0 - cdf_minus)
+        epsilon = r_tenor * f_mark * epsDiscount * (1.0 - cdf_plus)
+
+    # call / put symmetric greeks
+    gamma = (pdf_plus * discount) / (f_mark * vol * sqrt_t)
+    vega = f_mark * sqrt_t * pdf_plus * discount
+
+    return price, delta, gamma, vega, theta, rho, epsilon
+
+if NUMBA:
+    _black76_kernel = njit(cache=True, fastmath=True)(_black76_kernel)
+
 class CurrencyFutureOption(BaseInstrument):
 
-    def __init__(self, 
-                 otype : str, 
+    __slots__ = ("_otype", "_is_call", "strike", "expir", "price", "_vol",
+                 "_manual_vol", "moneyness", "probability", "_norm", "delta",
+                 "gamma", "vega", "theta", "rho", "epsilon", "_r_tenor",
+                 "_t_tenor", "_sqrtT", "_discount", "_logFK", "_update")
+
+    def __init__(self,
+                 otype : str,
                  strike : float, 
                  expir : datetime.datetime, 
                  lastVol : float | None = None,
@@ -760,6 +1405,10 @@ class CurrencyFutureOption(BaseInstrument):
         # inherit children
         super().__init__(**kwargs)
 
+        # pre-bind the hot update path onto the instance (skips the MRO walk
+        # on every derivative notification)
+        self._update = self._update_model
+
         # initialize variables
         self.otype = None
         self.strike = None
@@ -769,7 +1418,7 @@ class CurrencyFutureOption(BaseInstrument):
         self.vol = lastVol
         self.moneyness = None
         self.probability = None
-        self._norm = scipy.stats.norm(0, 1).cdf     # used for "self.probability()" in "_calc_implied()"
+        self._norm = ndtr     # used for "self.probability()" in "_calc_implied()"
 
         self.delta = None
         self.gamma = None
@@ -778,13 +1427,30 @@ class CurrencyFutureOption(BaseInstrument):
         self.rho = None
         self.epsilon = None
 
+        # per-tick invariants, populated by "_precompute()"
+        self._sqrtT = None
+        self._discount = None
+        self._logFK = None
+
         # set variables
         self.strike = strike
         self.expir = expir
+        self._recompute_tenor()
         self.otype = otype  # don't move, self._update() blocks until otype set
 
         return None
 
+    @property
+    def otype(self) -> str:
+        return self._otype
+
+    @otype.setter
+    def otype(self, otype : str | None) -> None:
+
+        # cache the call/put flag once, no string compares on the hot path
+        self._otype = otype
+        self._is_call = otype == "call"
+
     @property
     def vol(self) -> float:
         return self._vol
@@ -802,21 +1468,60 @@ class CurrencyFutureOption(BaseInstrument):
 
     @property
     def r_tenor(self) -> float:
-        return daycount.actual360_T(self.underlying.now, self.expir)
+
+        # live clock, recompute on every access
+        if self.underlying._now is None:
+            return daycount.actual360_T(self.underlying.now, self.expir)
+
+        # backtest clock, cached until "now" / "expir" changes
+        return self._r_tenor
 
     @property
     def t_tenor(self) -> float:
-        return daycount.trading_T(self.underlying.now, self.expir)
 
-    def _update(self) -> None:
-        
+        # live clock, recompute on every access
+        if self.underlying._now is None:
+            return daycount.trading_T(self.underlying.now, self.expir)
+
+        # backtest clock, cached until "now" / "expir" changes
+        return self._t_tenor
+
+    def _recompute_tenor(self) -> None:
+        '''
+
+        Overrides base method. Refreshes the cached expiration tenors so
+        repricing off each quote tick doesn't redo datetime arithmetic.
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        now = self.underlying.now
+        self._r_tenor = daycount.actual360_T(now, self.expir)
+        self._t_tenor = daycount.trading_T(now, self.expir)
+
+        return None
+
+    def _update_model(self) -> None:
+
         # not all variables present
         if None in [self.underlying.ccr,  self.underlying.ccq, self.otype]:
             pass
         
         # ensure prices available
-        elif (isinstance(self.bid, (float, int)) or isinstance(self.ask, (float, int)) ) and isinstance(self.underlying.mark, (float, int)):    
-            
+        elif (self.bid is not None or self.ask is not None ) and self.underlying.mark is not None:
+
+            # refresh sqrt(T) / discount / log(F/K) once per tick - the
+            # implied-vol solve and the pricer both read the cached copies
+            self._precompute()
+
             # if "self.vol" setter didn't trigger update, calculated implied vol
             if not self._manual_vol:
                 self._calc_implied()
@@ -829,32 +1534,38 @@ class CurrencyFutureOption(BaseInstrument):
 
         return None
 
-    def _newton_implied(self, 
-                        vol : float, realPrice : float, otype : str, 
-                        ccr : float, r_tenor : float, t_tenor : float, 
-                        f_mark : float, strike : float) -> float:
+    def _precompute(self) -> None:
+        '''
 
-        # Black-76 Variables
-        discount = np.exp((-ccr) * r_tenor)
-        d_plus = (np.log(f_mark / strike) + (vol**2 / 2) * t_tenor) / (vol * np.sqrt(t_tenor))
-        d_minus = d_plus - vol * np.sqrt(t_tenor)
+        Memoizes the expensive vol-independent scalars - sqrt(t_tenor),
+        exp(-ccr * r_tenor), and log(mark / strike) - so one tick pays for
+        each transcendental once rather than once per solver iteration.
 
-        # Black-76 Option Pricing Model (OPM)
-        if otype == "call":
-            estPrice = discount * (f_mark * scipy.stats.norm.cdf(d_plus) - strike * scipy.stats.norm.cdf(d_minus))
 
-        elif otype == "put":
-            estPrice = discount * (strike * scipy.stats.norm.cdf(-d_minus) - f_mark * scipy.stats.norm.cdf(-d_plus))
+        Parameters
+        ----------
+        `None`
 
-        return estPrice - realPrice
+        Returns
+        -------
+        `None`
 
-    def _corrado_miller_implied(self, 
-                                realPrice : float, otype : str, 
-                                t_tenor : float, f_mark : float, 
-                                strike : float, discount : float) -> float:
+        '''
+
+        self._sqrtT = math.sqrt(self.t_tenor)
+        self._discount = math.exp((-self.underlying.ccr) * self.r_tenor)
+        self._logFK = math.log(self.underlying.mark / self.strike)
+
+        return None
+
+    def _corrado_miller_implied(self,
+                                realPrice : float, isCall : bool,
+                                t_tenor : float, f_mark : float,
+                                strike : float, discount : float,
+                                ccr : float) -> float:
 
         # Put-Call Parity as needed, Corrado & Miller written for calls
-        if otype == "put":
+        if not isCall:
 
             # C - P = D * (F - K)
             C = realPrice + discount * (f_mark - strike)
@@ -866,47 +1577,58 @@ class CurrencyFutureOption(BaseInstrument):
         left = np.sqrt(2 * np.pi) * ( ( C - ( (f_mark*discount - strike*discount) / 2) ) / (f_mark*discount + strike*discount) )
         rightLeft = 2*np.pi * ( ( C - ( (f_mark*discount - strike*discount) / 2) ) / (f_mark*discount + strike*discount) )**2
         rightRight = 1.85 * ( (f_mark*discount - strike*discount)**2 / (4*np.pi * (f_mark*discount + strike*discount) * np.sqrt(strike*discount*f_mark*discount)) )
-        
+
+        # the C&M discriminant goes negative for deep OTM / ITM strikes,
+        # which used to seed Newton with NaN - fall back to Higham's
+        # inflection-point seed there (guaranteed-convergent starting point)
+        discArg = rightLeft - rightRight
+        if discArg <= 0:
+            estVol = math.sqrt(abs((2.0 / t_tenor) * (math.log(strike / f_mark) + ccr * t_tenor)))
+
+            return min(max(estVol, 0.05), 3.0)
+
         # Corrado & Miller's estimate
-        estVol = left + np.sqrt(rightLeft - rightRight) / np.sqrt(t_tenor)
+        estVol = left + np.sqrt(discArg) / np.sqrt(t_tenor)
 
         return estVol
 
     def _calc_implied(self) -> None:
 
         # pull static variables
-        otype = self.otype
+        isCall = self._is_call
         strike = self.strike
         t_tenor = self.t_tenor
-        r_tenor = self.r_tenor
         f_mark = self.underlying.mark
-        discount = np.exp((-self.underlying.ccr) * self.r_tenor)
-        ccr = self.underlying.ccr
+
+        # vol-independent invariants, cached once per tick by "_precompute()"
+        discount = self._discount
+        log_fk = self._logFK
+        sqrt_t = self._sqrtT
 
         # set initial vol estimate
         rerun = False
-        if isinstance(self.vol, NoneType):
+        if self.vol is None:
             
             # will need to rerun entire function once final implied vol calculated,
             # this vol is an initial estimate for bid-ask weights when picking mark
             rerun = True
 
             # choose nearest mark, consider null contracts 0
-            if isinstance(self.bid, NoneType):
+            if self.bid is None:
                 tempMark = self.ask
-            elif isinstance(self.ask, NoneType):
+            elif self.ask is None:
                 tempMark = self.bid
             else:
                 tempMark = (self.bid * .5) + (self.ask * .5)
 
             # there must must be intrinsic value no matter how far in the money
-            if (otype == "call") and (f_mark >= strike + tempMark):
+            if isCall and (f_mark >= strike + tempMark):
                 
                 # will either drop between bid / ask, or only be worth intrinsic value
                 tempPrice = (f_mark - strike)
             
             # there must be intrinsic value no matter how far in the money
-            elif (otype == "put") and (f_mark <= strike - tempMark):
+            elif (not isCall) and (f_mark <= strike - tempMark):
                 
                 # will either drop between bid / ask, or only be worth intrinsic value
                 tempPrice = (strike - f_mark)
@@ -916,15 +1638,16 @@ class CurrencyFutureOption(BaseInstrument):
                 tempPrice = tempMark
 
             # initial vol estimate
-            self._vol = self._corrado_miller_implied(tempPrice, otype, t_tenor, 
-                                                     f_mark, strike, discount)
+            self._vol = self._corrado_miller_implied(tempPrice, isCall, t_tenor,
+                                                     f_mark, strike, discount,
+                                                     self.underlying.ccr)
 
         # estimate standardized moneyness (vol adjusted, time independent):
-        if otype == "call":
-            self.moneyness = np.log(f_mark / strike) / ( np.sqrt(t_tenor) * self.vol )
+        if isCall:
+            self.moneyness = log_fk / ( sqrt_t * self.vol )
 
-        elif otype == "put":
-            self.moneyness = np.log(strike / f_mark) / ( np.sqrt(t_tenor) * self.vol )
+        else:
+            self.moneyness = (-log_fk) / ( sqrt_t * self.vol )
 
         # probability of closing ITM
         self.probability = self._norm(self.moneyness)
@@ -940,21 +1663,21 @@ class CurrencyFutureOption(BaseInstrument):
             bidAdj = 1 - askAdj
 
         # consider null contracts 0, adjust for weights this time
-        if isinstance(self.bid, NoneType):
+        if self.bid is None:
             newTempMark = self.ask
-        elif isinstance(self.ask, NoneType):
+        elif self.ask is None:
             newTempMark = self.bid
         else:
             newTempMark = (self.bid * bidAdj) + (self.ask * askAdj)
 
         # there must must be intrinsic value no matter how far in the money
-        if (otype == "call") and (f_mark - strike > newTempMark):
+        if isCall and (f_mark - strike > newTempMark):
             
             # will either drop between bid / ask, or only be worth intrinsic value
             realPrice = (f_mark - strike)
         
         # there must be intrinsic value no matter how far in the money
-        elif (otype == "put") and (strike - f_mark > newTempMark):
+        elif (not isCall) and (strike - f_mark > newTempMark):
             
             # will either drop between bid / ask, or only be worth intrinsic value
             realPrice = (strike - f_mark)
@@ -962,10 +1685,37 @@ class CurrencyFutureOption(BaseInstrument):
         else:
             realPrice = newTempMark
 
-        # estimate implied vol via Newton-Raphson convergence (first guess is either prior vol or Corrado-Miller estimate)
-        self._vol = scipy.optimize.newton(self._newton_implied, self.vol,
-                                          args=(realPrice, otype, ccr, r_tenor, 
-                                                t_tenor, f_mark, strike))
+        # estimate implied vol, three-tier routing:
+        #   1) Jaeckel's "Let's Be Rational" when installed - constant-time,
+        #      machine-precision, no iterations (prices Black on the
+        #      undiscounted forward, hence realPrice / discount)
+        #   2) Newton-Raphson near the money (first guess is either prior
+        #      vol or Corrado-Miller estimate)
+        #   3) bracketed Brent for deep OTM / ITM strikes, where vega
+        #      collapses and Newton steps blow up
+        solved = None
+        if LBR:
+            try:
+                solved = _lbr(realPrice / discount, f_mark, strike, t_tenor,
+                              1.0 if isCall else -1.0)
+
+            except Exception:
+                solved = None
+
+        if solved is not None and solved == solved and solved > 0.0:
+            self._vol = solved
+
+        elif abs(f_mark - strike) > 0.2 * f_mark:
+            self._vol = scipy.optimize.brentq(_black76_residual, 1e-6, 5.0,
+                                              args=(realPrice, isCall,
+                                                    discount, log_fk, sqrt_t,
+                                                    t_tenor, f_mark, strike),
+                                              xtol=1e-8)
+
+        else:
+            self._vol = _black76_implied_newton(self.vol, realPrice, isCall,
+                                                discount, log_fk, sqrt_t,
+                                                t_tenor, f_mark, strike)
         
         # in initializing, rerun with new implied vol to narrow estimates
         if rerun:
@@ -975,86 +1725,199 @@ class CurrencyFutureOption(BaseInstrument):
 
     def _calc_price(self) -> None:
 
-        # Black-76 Variables
-        discount = np.exp((-self.underlying.ccr) * self.r_tenor)
-        d_plus = (np.log(self.underlying.mark / self.strike) + (self.vol**2 / 2) * self.t_tenor) / (self.vol * np.sqrt(self.t_tenor))
-        d_minus = d_plus - self.vol * np.sqrt(self.t_tenor)
+        # pull static variables
+        f_mark = self.underlying.mark
+        strike = self.strike
+        vol = self.vol
+        ccr = self.underlying.ccr
+        r_tenor = self.r_tenor
+        t_tenor = self.t_tenor
 
-        # Black-76 Option Pricing Model (OPM)
-        if self.otype == "call":
-            self.price = discount * (self.underlying.mark * scipy.stats.norm.cdf(d_plus) - self.strike * scipy.stats.norm.cdf(d_minus))
+        # jitted fused kernel when numba's available - one compiled call
+        # returns price and every greek (dailyTheta / ccq are passed in as
+        # scalars since the kernel can't reach daycount or self)
+        if NUMBA:
+            (self.price, self.delta, self.gamma, self.vega, self.theta,
+             self.rho, self.epsilon) = _black76_kernel(
+                f_mark, strike, t_tenor, r_tenor, ccr, self.underlying.ccq,
+                vol, self._is_call, 1 / daycount.trading_days())
+
+            return None
+
+        # Black-76 Variables - discount, sqrt(t), and log(F/K) come off the
+        # per-tick cache refreshed by "_precompute()"
+        discount = self._discount
+        sqrt_t = self._sqrtT
+        d_plus = (self._logFK + (vol*vol / 2) * t_tenor) / (vol * sqrt_t)
+        d_minus = d_plus - vol * sqrt_t
+
+        cdf_plus = ndtr(d_plus)
+        cdf_minus = ndtr(d_minus)
+        pdf_plus = _npdf(d_plus)
+
+        epsDiscount = math.exp((-self.underlying.ccq) * r_tenor)
+        dailyTheta = 1 / daycount.trading_days()
+
+        # Black-76 Option Pricing Model (OPM) and greeks - note
+        # ndtr(-x) == 1 - ndtr(x), so the put side reuses the call CDFs
+        if self._is_call:
+            self.price = discount * (f_mark * cdf_plus - strike * cdf_minus)
+            self.delta = discount * cdf_plus
+
+            one = (f_mark * pdf_plus * vol * discount) / (2.0 * sqrt_t)
+            two = ccr * f_mark * cdf_plus * discount
+            three = ccr * strike * discount * cdf_minus
+            self.theta = ( (-one) + two - three ) * dailyTheta  # daily theta
+
+            self.rho = strike * r_tenor * discount * cdf_minus
+            self.epsilon = (-r_tenor) * f_mark * epsDiscount * cdf_plus
 
-        elif self.otype == "put":
-            self.price = discount * (self.strike * scipy.stats.norm.cdf(-d_minus) - self.underlying.mark * scipy.stats.norm.cdf(-d_plus))
+        else:
+            self.price = discount * (strike * (1.0 - cdf_minus) - f_mark * (1.0 - cdf_plus))
+            self.delta = discount * (cdf_plus - 1.0)
+
+            one = (f_mark * pdf_plus * vol * discount) / (2.0 * sqrt_t)
+            two = ccr * f_mark * (1.0 - cdf_plus) * discount
+            three = ccr * strike * discount * (1.0 - cdf_minus)
+            self.theta = ( (-one) - two + three ) * dailyTheta  # daily theta
 
-        # Black-76 Greeks
-        self._calc_delta(discount, d_plus)
-        self._calc_gamma(discount, d_plus)
-        self._calc_vega(discount, d_plus)
-        self._calc_theta(discount, d_plus, d_minus)
-        self._calc_rho(discount, d_minus)
-        self._calc_epsilon(d_plus)
+            self.rho = (-strike) * r_tenor * discount * (1.0 - cdf_minus)
+            self.epsilon = r_tenor * f_mark * epsDiscount * (1.0 - cdf_plus)
+
+        # call / put symmetric greeks
+        self.gamma = (pdf_plus * discount) / (f_mark * vol * sqrt_t)
+        self.vega = f_mark * sqrt_t * pdf_plus * discount
 
         return None
 
-    def _calc_delta(self, discount : float, d_plus : float) -> None:
 
-        if self.otype == "call":
-            self.delta = discount * scipy.stats.norm.cdf(d_plus)
+class OptionBook:
+    '''
 
-        elif self.otype == "put":
-            self.delta = discount * (scipy.stats.norm.cdf(d_plus) - 1.0)
+    A structure-of-arrays view over a collection of CurrencyFutureOption
+    instances sharing one underlying. Per-option scalars (strike, vol,
+    call/put flag, tenors) are packed into parallel NumPy arrays so the
+    whole book can be repriced with one vectorized Black-76 pass instead
+    of walking Python objects attribute by attribute.
 
-        return None
 
-    def _calc_gamma(self, discount : float, d_plus : float) -> None:
+    Attributes
+    ----------
+    `options` : list
+        The CurrencyFutureOption instances backing the book.
 
-        self.gamma = (scipy.stats.norm.pdf(d_plus) * discount) / (self.underlying.mark * self.vol * np.sqrt(self.t_tenor))
+    `strikes` : np.ndarray
+        The strike of each option.
 
-        return None
+    `isCall` : np.ndarray
+        Whether each option is a call.
 
-    def _calc_vega(self, discount : float, d_plus : float) -> None:
+    `vols` : np.ndarray
+        The implied volatility of each option.
 
-        self.vega = self.underlying.mark * np.sqrt(self.t_tenor) * scipy.stats.norm.pdf(d_plus) * discount
+    `prices` : np.ndarray
+        The modeled price of each option, populated by "revalue_all()".
 
-        return None
+    Methods
+    -------
+    `refresh()` -> None
+        Re-packs the per-option arrays from the instances.
 
-    def _calc_theta(self, discount : float, d_plus : float, d_minus : float) -> None:
+    `revalue_all()` -> None
+        Reprices the entire book in one vectorized Black-76 pass and writes
+        the modeled prices back onto the instances.
 
-        if self.otype == "call":
-            one = (self.underlying.mark * scipy.stats.norm.pdf(d_plus) * self.vol * discount) / (2.0 * np.sqrt(self.t_tenor))
-            two = self.underlying.ccr * self.underlying.mark * scipy.stats.norm.cdf(d_plus) * discount
-            three = self.underlying.ccr * self.strike * discount * scipy.stats.norm.cdf(d_minus)
+    '''
+
+    __slots__ = ("options", "strikes", "isCall", "vols", "r_tenors",
+                 "t_tenors", "prices")
+
+    def __init__(self, options : list) -> None:
+        '''
+
+        Initializes the OptionBook object.
+
+
+        Parameters
+        ----------
+        `options` : list
+            CurrencyFutureOption instances sharing a single underlying.
 
-            self.theta = ( (-one) + two - three ) * ( 1 / daycount.trading_days() )  # daily theta
+        Returns
+        -------
+        `OptionBook` : object
+            The OptionBook instance.
 
-        elif self.otype == "put":
-            one = (self.underlying.mark * scipy.stats.norm.pdf(d_plus) * self.vol * discount) / (2.0 * np.sqrt(self.t_tenor))
-            two = self.underlying.ccr * self.underlying.mark * scipy.stats.norm.cdf(-d_plus) * discount
-            three = self.underlying.ccr * self.strike * discount * scipy.stats.norm.cdf(-d_minus)
+        '''
 
-            self.theta = ( (-one) - two + three ) * ( 1 / daycount.trading_days() ) # daily theta
+        self.options = list(options)
+        self.prices = np.empty(len(self.options))
+        self.refresh()
 
         return None
 
-    def _calc_rho(self, discount : float, d_minus : float) -> None:
+    def refresh(self) -> None:
+        '''
+
+        Re-packs the per-option arrays from the instances. Call after adding
+        options, setting vols manually, or moving the backtest clock.
 
-        if self.otype == "call":
-            self.rho = self.strike * self.r_tenor * discount * scipy.stats.norm.cdf(d_minus)
 
-        elif self.otype == "put":
-            self.rho = (-self.strike) * self.r_tenor * discount * scipy.stats.norm.cdf(-d_minus)
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        options = self.options
+        self.strikes = np.array([option.strike for option in options], dtype=np.float64)
+        self.isCall = np.array([option._is_call for option in options], dtype=bool)
+        self.vols = np.array([option.vol for option in options], dtype=np.float64)
+        self.r_tenors = np.array([option.r_tenor for option in options], dtype=np.float64)
+        self.t_tenors = np.array([option.t_tenor for option in options], dtype=np.float64)
 
         return None
 
-    def _calc_epsilon(self, d_plus : float) -> None:
-    
-        if self.otype == "call":
-            self.epsilon = (-self.r_tenor) * self.underlying.mark * np.exp((-self.underlying.ccq) * self.r_tenor) * scipy.stats.norm.cdf(d_plus)
+    def revalue_all(self) -> None:
+        '''
+
+        Reprices the entire book in one vectorized Black-76 pass off the
+        shared underlying's current mark, writing the modeled prices back
+        onto the instances.
+
+
+        Parameters
+        ----------
+        `None`
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        underlying = self.options[0].underlying
+
+        # whole-book Black-76 pass, price and greeks together
+        chain = price_chain_black76(underlying.mark, self.strikes,
+                                    self.t_tenors, self.r_tenors,
+                                    underlying.ccr, self.vols, self.isCall)
+
+        np.copyto(self.prices, chain["price"])
+
+        # write back onto the instances
+        for i, option in enumerate(self.options):
+            option.price = self.prices[i]
+            option.delta = chain["delta"][i]
+            option.gamma = chain["gamma"][i]
+            option.vega = chain["vega"][i]
+            option.theta = chain["theta"][i]
+            option.rho = chain["rho"][i]
 
-        elif self.otype == "put":
-            self.epsilon = self.r_tenor * self.underlying.mark * np.exp((-self.underlying.ccq) * self.r_tenor) * scipy.stats.norm.cdf(-d_plus)
-            
         return None
 
 
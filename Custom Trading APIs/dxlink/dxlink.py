@@ -1,21 +1,228 @@
 from __future__ import annotations
 import asyncio
+import itertools
 import threading
 from websockets import client
-import json
+import orjson
 import numpy as np
 import pandas as pd
 import datetime
 import concurrent
-from types import NoneType
 import sys
 sys.path.append("<path here>")
 import markethours
 
+# prebuilt payload templates - these messages are identical apart from the
+# channel number, so the setup / keep-alive paths substitute into a cached
+# string instead of re-running json.dumps on the same dict every call
+_SETUP_MSG = '{"type":"SETUP","channel":0,"keepaliveTimeout":300,"acceptKeepaliveTimeout":300,"version":"0.1-js/1.0.0"}'
+_KEEPALIVE_MSG = '{"type":"KEEPALIVE","channel":0}'
+_CHANNEL_REQ_TMPL = '{"type":"CHANNEL_REQUEST","channel":%d,"service":"FEED","parameters":{"contract":"AUTO"}}'
+_CHANNEL_CANCEL_TMPL = '{"type":"CHANNEL_CANCEL","channel":%d}'
+_FEED_SETUP_QUOTE_TMPL = '{"type":"FEED_SETUP","channel":%d,"acceptAggregationPeriod":1,"acceptDataFormat":"COMPACT","acceptEventFields":{"Quote":["eventSymbol","bidPrice","bidSize","askPrice","askSize"]}}'
+_FEED_SETUP_TRADE_TMPL = '{"type":"FEED_SETUP","channel":%d,"acceptAggregationPeriod":1,"acceptDataFormat":"COMPACT","acceptEventFields":{"Trade":["eventSymbol","price","dayVolume","dayTurnover"]}}'
+_FEED_SETUP_CANDLE_TMPL = '{"type":"FEED_SETUP","channel":%d,"acceptAggregationPeriod":1,"acceptDataFormat":"COMPACT","acceptEventFields":{"Candle":["time","open","high","low","close","impVolatility"]}}'
+
+# candle column labels - shared by every per-channel frame, with the
+# codes prebuilt so MultiIndex construction skips the general
+# from_product path
+_OHLC = ("open", "high", "low", "close")
+_OHLC_CODES = [[0, 0, 0, 0], [0, 1, 2, 3]]
+
+def _span_ms(span : str) -> int:
+    '''
+
+    Converts a candlestick span ("<#>s", "<#>m", "<#>h", "<#>d", "<#>w",
+    "<#>mo") to its period in milliseconds. Months are approximated at 31
+    days - only used to size receive buffers, so overshooting is harmless.
+
+
+    Parameters
+    ----------
+    `span` : str
+        The candlestick span.
+
+    Returns
+    -------
+    `int`
+        The span's period in milliseconds.
+
+    '''
+
+    if span.endswith("mo"):
+        return int(span[:-2]) * 2678400000
+
+    units = {"s" : 1000, "m" : 60000, "h" : 3600000,
+             "d" : 86400000, "w" : 604800000}
+
+    return int(span[:-1]) * units[span[-1]]
+
+class _QuoteBuffer():
+    '''
+
+    Struct-of-arrays storage for one channel's quote stream. The old design
+    rebuilt a fresh dict per symbol per message - 4-5 hash-table writes and
+    a datetime each - which is pure GC pressure at feed rates. Here each
+    field lives in one contiguous NumPy array indexed by a symbol -> row
+    lookup, so an update is a handful of O(1) scalar stores, and dicts are
+    only materialized on read.
+
+
+    Attributes
+    ----------
+    `_symIdx` : dict
+        Maps each symbol to its row in the field arrays.
+
+    `_ts` : list
+        Per-row message arrival timestamps.
+
+    `_bid`, `_bidSize`, `_ask`, `_askSize` : np.ndarray
+        Per-row live quote fields.
+
+    `_volume`, `_turnover` : np.ndarray
+        Per-row last-trade fields (market closed).
+
+    `_live` : np.ndarray
+        Whether each row last updated off a live quote or a last trade.
+
+    Methods
+    -------
+    `update_quote()` -> None
+        Records a live quote for a symbol.
+
+    `update_trade()` -> None
+        Records a last-trade entry for a symbol.
+
+    `get()` -> dict
+        Materializes a symbol's most recent entry as a dict.
+
+    `all()` -> dict
+        Materializes every symbol's most recent entry.
+
+    '''
+
+    __slots__ = ("_symIdx", "_ts", "_bid", "_bidSize", "_ask", "_askSize",
+                 "_volume", "_turnover", "_live")
+
+    def __init__(self, capacity : int = 64) -> None:
+        '''
+
+        Initializes the `_QuoteBuffer()` instance.
+
+
+        Parameters
+        ----------
+        `capacity` : int = 64
+            The initial number of symbol rows to allocate (grows on demand).
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        self._symIdx = {}
+        self._ts = [None] * capacity
+        self._bid = np.full(capacity, np.nan)
+        self._bidSize = np.full(capacity, np.nan)
+        self._ask = np.full(capacity, np.nan)
+        self._askSize = np.full(capacity, np.nan)
+        self._volume = np.full(capacity, np.nan)
+        self._turnover = np.full(capacity, np.nan)
+        self._live = np.zeros(capacity, dtype=np.bool_)
+
+        return None
+
+    def _index(self, symbol : str) -> int:
+
+        # row lookup, allocating a new row the first time a symbol shows up
+        idx = self._symIdx.get(symbol)
+        if idx is None:
+            idx = len(self._symIdx)
+
+            if idx == self._bid.shape[0]:
+                self._grow()
+
+            self._symIdx[symbol] = idx
+
+        return idx
+
+    def _grow(self) -> None:
+
+        # double every field array, preserving existing rows
+        self._ts.extend([None] * len(self._ts))
+
+        for name in ("_bid", "_bidSize", "_ask", "_askSize",
+                     "_volume", "_turnover"):
+            old = getattr(self, name)
+            new = np.full(old.shape[0] * 2, np.nan)
+            new[:old.shape[0]] = old
+            setattr(self, name, new)
+
+        live = np.zeros(self._live.shape[0] * 2, dtype=np.bool_)
+        live[:self._live.shape[0]] = self._live
+        self._live = live
+
+        return None
+
+    def update_quote(self, symbol : str, bid, bidSize, ask, askSize,
+                     stamp : datetime.datetime) -> None:
+
+        i = self._index(symbol)
+        self._ts[i] = stamp
+        self._bid[i] = bid
+        self._bidSize[i] = bidSize
+        self._ask[i] = ask
+        self._askSize[i] = askSize
+        self._live[i] = True
+
+        return None
+
+    def update_trade(self, symbol : str, last, volume, turnover,
+                     stamp : datetime.datetime) -> None:
+
+        i = self._index(symbol)
+        self._ts[i] = stamp
+        self._bid[i] = last
+        self._ask[i] = last
+        self._volume[i] = volume
+        self._turnover[i] = turnover
+        self._live[i] = False
+
+        return None
+
+    def get(self, symbol : str) -> dict:
+
+        i = self._symIdx[symbol]
+
+        # same dict shapes the per-message path used to build eagerly
+        if self._live[i]:
+            return {"eventTime" : self._ts[i],
+                    "bidPrice" : self._bid[i],
+                    "bidSize" : self._bidSize[i],
+                    "askPrice" : self._ask[i],
+                    "askSize" : self._askSize[i]}
+
+        return {"eventTime" : self._ts[i],
+                "bidPrice" : self._bid[i],
+                "askPrice" : self._ask[i],
+                "volume" : self._volume[i],
+                "turnover" : self._turnover[i]}
+
+    def all(self) -> dict:
+
+        return {symbol : self.get(symbol) for symbol in self._symIdx}
+
+    def __contains__(self, symbol : str) -> bool:
+        return symbol in self._symIdx
+
+    def __getitem__(self, symbol : str) -> dict:
+        return self.get(symbol)
+
 class Stream():
     '''
-    
-    A class used to encapsulate instrument quote streams - a `Stream()` instance 
+
+    A class used to encapsulate instrument quote streams - a `Stream()` instance
     points directly to the DXLink virtual channel used to begin the stream feed,
     allowing isolated streaming management.
 
@@ -28,8 +235,8 @@ class Stream():
     `_link` : DXLink
         The `DXLink()` object hosting the channel (used to start the stream).
     
-    `_stream` : dict
-        The streamed content.
+    `_stream` : _QuoteBuffer
+        The streamed content, stored column-wise per symbol.
     
     `_closeRequest` : str
         A prefabricated "close request" - triggered on `self.close()`, the request
@@ -100,11 +307,34 @@ class Stream():
         
         '''
         
-        if isinstance(symbol, NoneType):
-            return self._stream
+        if symbol is None:
+            return self._stream.all()
         else:
             return self._stream[symbol]
-    
+
+    def quote_batch(self, symbols : list) -> dict:
+        '''
+
+        Retrieves the most recent quotes for a batch of symbols in one call.
+
+
+        Parameters
+        ----------
+        `symbols` : list
+            The instruments to retrieve the most recent quotes for.
+
+        Returns
+        -------
+        `dict`
+            A dictionary of quotes, keyed by symbol. Symbols not yet present
+            in the stream are omitted.
+
+        '''
+
+        stream = self._stream
+
+        return {symbol : stream[symbol] for symbol in symbols if symbol in stream}
+
     async def _close(self) -> None:
         '''
 
@@ -212,9 +442,19 @@ class DXLink():
         self.afterHours = afterHours
 
         # content containers
-        self._channelLock = threading.Lock()
-        self._streams = {0 : []}
-        self._candles = {0 : []}
+        self._streams = {}
+        self._candles = {}
+
+        # dxlink requires odd channels - count(1, 2) hands them out in
+        # order, and next() is atomic under the GIL, so no lock is needed
+        # around channel allocation
+        self._nextChannel = itertools.count(1, 2)
+
+        # per-channel payload layout ("quote" / "trade"), fixed at setup
+        self._channelMode = {}
+
+        # per-channel completion events for candle requests
+        self._candleEvents = {}
 
         # create an event loop (avoiding asyncio.run(), etc)
         # begins indefinite event loop - the loop is running WITHIN another
@@ -234,7 +474,7 @@ class DXLink():
         asyncio.run_coroutine_threadsafe(self._receive(), self._loop)
 
         # use cached token if none provided
-        if isinstance(auth, NoneType):
+        if auth is None:
             with open("<key here>") as file:
                 auth = file.read()
 
@@ -291,25 +531,20 @@ class DXLink():
         '''
         
         # configure websocket connection
-        setupPayload = json.dumps({"type": "SETUP",
-                                   "channel": 0,
-                                   "keepaliveTimeout": 300,
-                                   "acceptKeepaliveTimeout": 300,
-                                   "version": "0.1-js/1.0.0"})
-        await self._ws.send(setupPayload)
+        await self._ws.send(_SETUP_MSG)
 
         # auth with dxlink
-        authPayload = json.dumps({"type": "AUTH",
+        authPayload = orjson.dumps({"type": "AUTH",
                                   "channel": 0,
-                                  "token": auth})
+                                  "token": auth}).decode()
         await self._ws.send(authPayload)
 
         return None
 
-    async def _process(self, message : str) -> None:
+    def _process(self, message : str) -> None:
         '''
-        
-        Converts any DXLink response into a dictionary object, then 
+
+        Converts any DXLink response into a dictionary object, then
         places it in the appropriate channel storage location (`self._channels[X]`)
 
         
@@ -323,68 +558,138 @@ class DXLink():
         `None`
         
         '''
-        message = json.loads(message)
+        # orjson parses straight from the wire bytes, roughly 2-3x faster
+        # than stdlib json on these small frames - this runs per message
+        message = orjson.loads(message)
         
         if (message["channel"] in self._streams.keys()) and (message["type"] == "FEED_DATA"):
             
             # timestamp message arrival
             stamp = datetime.datetime.now(tz=datetime.UTC)
 
-            # sort by market status (avoids calling cme.is_trading(), datetime calculations expensive)
-            if len(message["data"][1]) > 5:
-                if isinstance(message["data"][1][5], str) and (message["data"][1][5] != "NaN"):
-                    marketOpen = True
-                else:
-                    marketOpen = False
-            else:
-                if len(message["data"][1]) % 2 == 1:
-                    marketOpen = True
-                else:
-                    marketOpen = False
-
-            # if market open, live quote message: [symbol, bid, bidSize, ask, askSize] (odd number)
-            if marketOpen:
-
-                # for each symbol in the stream, record the current bid, ask and respective sizes
-                for i in range(0, len(message["data"][1]), 5):
-                    
-                        self._streams[message["channel"]][message["data"][1][i]] = {"eventTime" : stamp,
-                                                                                    "bidPrice" : message["data"][1][i+1],
-                                                                                    "bidSize" : message["data"][1][i+2],
-                                                                                    "askPrice" : message["data"][1][i+3],
-                                                                                    "askSize" : message["data"][1][i+4]}
-
-            # market closed, record last trades: [symbol, lastPrice, dailyVolume, dailyTurnover] (even number)
+            buffer = self._streams[message["channel"]]
+            data = message["data"][1]
+
+            # the payload layout was fixed when the channel's feed was
+            # configured - no per-message length / isinstance sniffing
+            if self._channelMode[message["channel"]] == "quote":
+                self._process_quote(buffer, data, stamp)
+
             else:
-             
-                # for each symbol in the stream, record the prior session's closing details
-                for i in range(0, len(message["data"][1]), 4):
-                    self._streams[message["channel"]][message["data"][1][i]] = {"eventTime" : stamp,
-                                                                                "bidPrice" : message["data"][1][i+1],
-                                                                                "askPrice" : message["data"][1][i+1],
-                                                                                "volume" : message["data"][1][i+2],
-                                                                                "turnover" : message["data"][1][i+3]}
+                self._process_trade(buffer, data, stamp)
 
         elif (message["channel"] in self._candles.keys()) and (message["type"] == "FEED_DATA"):
 
-            # timestamp message arrival
-            stamp = datetime.datetime.now(tz=datetime.UTC)
-
             # only one candle ID per candle channel
-            candleID = list(self._candles[message["channel"]].keys())[0]
-            for i in range(0, len(message["data"][1]), 5):
-                
-                # only accept relevant data (dxlink starts to stream live after sending historic)
-                # greater than or equal to "from time", ealier than or equal to "request time"
-                if (candleID[2] <= message["data"][1][i]) and (message["data"][1][i] <= candleID[3]):
-                    
-                    # appends all payloads to single candle list even if received in different messages
-                    entry = message["data"][1][i:i+5]
-                    self._candles[message["channel"]][candleID].append(entry)
-
-                    # if final candle, convert to numpy - type() will be used to identify when ready to convert to dataframe
-                    if candleID[2] == message["data"][1][i]:
-                        self._candles[message["channel"]][candleID] = np.array(self._candles[message["channel"]][candleID]).astype(float)
+            container = self._candles[message["channel"]]
+
+            # channel already flushed by _get_candles() - the cancel request
+            # goes out fire-and-forget, so a straggler FEED_DATA can still
+            # arrive after the flush; nothing left to record it into
+            if not container:
+                return None
+
+            candleID = next(iter(container))
+            entry = container[candleID]
+
+            # already finalized - dxlink starts to stream live after
+            # sending historic, ignore the stragglers
+            if isinstance(entry, np.ndarray):
+                return None
+
+            buf, cursor = entry
+
+            # whole message at once - rows land straight in the
+            # preallocated buffer, no list appends / re-copies
+            rows = np.asarray(message["data"][1], dtype=np.float64).reshape(-1, 5)
+
+            # only accept relevant data (dxlink starts to stream live after sending historic)
+            # greater than or equal to "from time", ealier than or equal to "request time"
+            mask = (candleID[2] <= rows[:, 0]) & (rows[:, 0] <= candleID[3])
+            kept = int(mask.sum())
+
+            if kept:
+
+                # grow if the span estimate undershot (e.g. extended hours)
+                if cursor + kept > buf.shape[0]:
+                    grown = np.empty((max(buf.shape[0] * 2, cursor + kept), 5))
+                    grown[:cursor] = buf[:cursor]
+                    buf = grown
+                    entry[0] = buf
+
+                buf[cursor:cursor+kept] = rows[mask]
+                entry[1] = cursor + kept
+
+                # if final candle, trim to a plain array - type() will be used to identify when ready to convert to dataframe
+                if (rows[:, 0] == candleID[2]).any():
+                    container[candleID] = buf[:entry[1]]
+
+                    # wake the waiting _process_candles coroutine
+                    self._candleEvents[message["channel"]].set()
+
+        return None
+
+    def _process_quote(self, buffer : _QuoteBuffer, data : list,
+                       stamp : datetime.datetime) -> None:
+        '''
+
+        Records a live quote message into the channel's buffer:
+        [symbol, bid, bidSize, ask, askSize] per symbol.
+
+
+        Parameters
+        ----------
+        `buffer` : _QuoteBuffer
+            The channel's quote storage.
+
+        `data` : list
+            The flattened COMPACT payload.
+
+        `stamp` : datetime.datetime
+            The message arrival timestamp.
+
+        Return
+        ------
+        `None`
+
+        '''
+
+        # for each symbol in the stream, record the current bid, ask and respective sizes
+        for i in range(0, len(data), 5):
+            buffer.update_quote(data[i], data[i+1], data[i+2],
+                                data[i+3], data[i+4], stamp)
+
+        return None
+
+    def _process_trade(self, buffer : _QuoteBuffer, data : list,
+                       stamp : datetime.datetime) -> None:
+        '''
+
+        Records a last-trade message into the channel's buffer:
+        [symbol, lastPrice, dailyVolume, dailyTurnover] per symbol.
+
+
+        Parameters
+        ----------
+        `buffer` : _QuoteBuffer
+            The channel's quote storage.
+
+        `data` : list
+            The flattened COMPACT payload.
+
+        `stamp` : datetime.datetime
+            The message arrival timestamp.
+
+        Return
+        ------
+        `None`
+
+        '''
+
+        # for each symbol in the stream, record the prior session's closing details
+        for i in range(0, len(data), 4):
+            buffer.update_trade(data[i], data[i+1], data[i+2],
+                                data[i+3], stamp)
 
         return None
 
@@ -405,10 +710,17 @@ class DXLink():
         '''
 
         async for message in self._ws:
-            # for each message, process it in background (allows multiple
-            # message to be processed as they come in)
-            asyncio.create_task(self._process(message))
-        
+            # _process is pure CPU work (parse + buffer stores) with no
+            # awaits - calling it inline skips a coroutine allocation and
+            # scheduler hop per message, and keeps processing in arrival
+            # order; a bad message must never escape, though - that would
+            # kill the receive loop (and with it every stream) for good
+            try:
+                self._process(message)
+
+            except Exception as error:
+                print("dxlink: dropped message ({!r})".format(error), file=sys.stderr)
+
         return None
 
     async def _keepalive(self) -> None:
@@ -428,13 +740,10 @@ class DXLink():
         
         '''
         
-        # keep-alive message
-        keepAliveMsg = json.dumps({"type": "KEEPALIVE", "channel": 0})
-
         while True:
-            
+
             # send keep-alive as-per DXLink docs (don't wait for response)
-            asyncio.create_task(self._quick_send(keepAliveMsg))
+            asyncio.create_task(self._quick_send(_KEEPALIVE_MSG))
 
             # wait to send next round of keep-alives
             await asyncio.sleep(15)
@@ -463,12 +772,15 @@ class DXLink():
         
         '''
 
+        # the socket already serializes writes - pushing each message
+        # through its own task only added create_task overhead and let
+        # sends land out of order
         if isinstance(messages, str):
-            asyncio.create_task(self._ws.send(messages))
+            await self._ws.send(messages)
 
         else:
             for message in messages:
-                asyncio.create_task(self._ws.send(message))
+                await self._ws.send(message)
 
         return None
 
@@ -495,13 +807,15 @@ class DXLink():
         
         '''
 
+        # serial awaits on the one socket - a TaskGroup per batch paid task
+        # creation and scheduling per message for writes that serialize on
+        # the websocket anyway
         if isinstance(messages, str):
             await self._ws.send(messages)
-        
+
         else:
-            async with asyncio.TaskGroup() as tg:
-                for message in messages:
-                    tg.create_task(self._ws.send(message))
+            for message in messages:
+                await self._ws.send(message)
 
         return None
 
@@ -530,37 +844,20 @@ class DXLink():
         if isinstance(newChannel, int):
 
             # set up channel
-            channelRequest = json.dumps({"type": "CHANNEL_REQUEST",
-                                         "channel": newChannel,
-                                         "service": "FEED",
-                                         "parameters": {"contract": "AUTO"}})
-
             # wait until channel request complete
-            await self._sync_send(channelRequest)
+            await self._sync_send(_CHANNEL_REQ_TMPL % newChannel)
 
             # configure feed according to data availability
             if self.cme.is_trading() and (not self.afterHours):
-                    
+
                 # configure feed for quote streaming
-                feedSetup = json.dumps({"type": "FEED_SETUP",
-                                        "channel": newChannel,
-                                        "acceptAggregationPeriod": 1,
-                                        "acceptDataFormat": "COMPACT",
-                                        "acceptEventFields": {"Quote": ["eventSymbol",
-                                                                        "bidPrice",
-                                                                        "bidSize",
-                                                                        "askPrice",
-                                                                        "askSize"]}})
+                feedSetup = _FEED_SETUP_QUOTE_TMPL % newChannel
+                self._channelMode[newChannel] = "quote"
+
             else:
                 # configure feed for last traded quote / daily volume / daily turnover during open hours
-                feedSetup = json.dumps({"type": "FEED_SETUP",
-                                        "channel": newChannel,
-                                        "acceptAggregationPeriod": 1,
-                                        "acceptDataFormat": "COMPACT",
-                                        "acceptEventFields": {"Trade" : ["eventSymbol", 
-                                                                         "price", 
-                                                                         "dayVolume",
-                                                                         "dayTurnover"]}})
+                feedSetup = _FEED_SETUP_TRADE_TMPL % newChannel
+                self._channelMode[newChannel] = "trade"
 
             # wait until feed configuration complete
             await self._sync_send(feedSetup)
@@ -569,38 +866,12 @@ class DXLink():
         else:
 
             # set up channels
-            channelRequests = []
-            for i in newChannel:
-                channelRequest = json.dumps({"type": "CHANNEL_REQUEST",
-                                             "channel": i,
-                                             "service": "FEED",
-                                             "parameters": {"contract": "AUTO"}})
-                channelRequests.append(channelRequest)
-
             # wait until channel requests are complete
-            async with asyncio.TaskGroup() as tg:
-                for channelRequest in channelRequests:
-                    tg.create_task(self._ws.send(channelRequest))
+            await self._sync_send([_CHANNEL_REQ_TMPL % i for i in newChannel])
 
             # configure feeds for candlestick data
-            feedSetups = []
-            for i in newChannel:
-                feedSetup = json.dumps({"type": "FEED_SETUP",
-                                        "channel": i,
-                                        "acceptAggregationPeriod": 1,
-                                        "acceptDataFormat": "COMPACT",
-                                        "acceptEventFields": {"Candle": ["time",
-                                                                         "open", 
-                                                                         "high", 
-                                                                         "low", 
-                                                                         "close",
-                                                                         "impVolatility"]}})
-                feedSetups.append(feedSetup)
-
             # wait until feed configurations are complete
-            async with asyncio.TaskGroup() as tg:
-                for feedSetup in feedSetups:
-                    tg.create_task(self._ws.send(feedSetup))
+            await self._sync_send([_FEED_SETUP_CANDLE_TMPL % i for i in newChannel])
 
         return None
 
@@ -625,65 +896,59 @@ class DXLink():
         
         '''
 
-        collected = {}
-        timeout = datetime.datetime.now()
-
         # key value of channel and candle IDs (used for iterating)
         candleIDs = {i : list(self._candles[i].keys())[0] for i in newChannels}
 
-        counter = 0
-        while counter < 3:
-
-            # async while loop nuance
-            await asyncio.sleep(0)
-
-            for channel, candleID in candleIDs.items():
-
-                # if numpy array, all frames have been received
-                if isinstance(self._candles[channel][candleID], np.ndarray) and (candleID not in collected.keys()):
-                    collected[candleID] = self._candles[channel][candleID]
-                    counter += 1
-
-                # 5 second timeout
-                elif (datetime.datetime.now() - timeout) > datetime.timedelta(seconds=5):
-                    
-                    # load any data received
-                    for chan, candID in candleIDs.items():
-                        
-                        # convert and record any unprocessed candles
-                        if (candID not in collected.keys()) and self._candles[chan][candID]:
-                            collected[candID] = np.array(self._candles[chan][candID]).astype(float)
-
-                    # break out of for- and while- loops
-                    counter = 3
-                    break
-
-        # convert to pandas
-        candles = None
-
-        for key, val in collected.items():
-            if isinstance(candles, NoneType):
-                columns = pd.MultiIndex.from_product([[key[1]], ["open", "high", "low", "close"]])
-                index = [datetime.datetime.fromtimestamp(int(stamp), tz=datetime.UTC) for stamp in val[:, 0] / 1000]
-                candles = pd.DataFrame(val[:, 1:].astype(float), index=index, columns=columns)
-            
-            else:
-                columns = pd.MultiIndex.from_product([[key[1]], ["open", "high", "low", "close"]])
-                index = [datetime.datetime.fromtimestamp(int(stamp), tz=datetime.UTC) for stamp in val[:, 0] / 1000]
-                additionals = pd.DataFrame(val[:, 1:].astype(float), index=index, columns=columns)
-                candles = candles.join(additionals, how="outer")
-        
+        # block until every channel's final candle lands - the message
+        # handler sets each channel's event on finalization, so this wakes
+        # exactly when data arrives instead of spinning on sleep(0)
+        waiters = [asyncio.ensure_future(self._candleEvents[i].wait()) for i in newChannels]
+        done, pending = await asyncio.wait(waiters, timeout=5)
+
+        # 5 second timeout - cancel the stragglers' waiters
+        for waiter in pending:
+            waiter.cancel()
+
+        collected = {}
+        for channel, candleID in candleIDs.items():
+
+            entry = self._candles[channel][candleID]
+
+            # if numpy array, all frames have been received
+            if isinstance(entry, np.ndarray):
+                collected[candleID] = entry
+
+            # timed out mid-stream - partial buffers flush whatever was
+            # written so far
+            elif entry[1]:
+                collected[candleID] = entry[0][:entry[1]]
+
+        # convert to pandas - timestamps convert in one vectorized
+        # pd.to_datetime call (no per-row datetime objects), and the
+        # bid / mark / ask frames outer-align in a single concat instead
+        # of incremental joins
+        frames = []
+        order = {"bid" : 0, "ask" : 1, "mark" : 2}
+        for key, val in sorted(collected.items(), key=lambda kv : order[kv[0][1]]):
+            columns = pd.MultiIndex(levels=[[key[1]], list(_OHLC)], codes=_OHLC_CODES)
+            index = pd.to_datetime(val[:, 0].astype(np.int64), unit="ms", utc=True)
+            frames.append(pd.DataFrame(val[:, 1:], index=index, columns=columns,
+                                       copy=False))
+
+        candles = pd.concat(frames, axis=1, join="outer", copy=False)
+
         candles.index.name = "datetime"
-        
-        # flip such that ordered from latest to earliest
-        candles = candles[::-1]
 
         # often times, the "from time" requested will not align with a
-        # candle period - this results in a oneliner of NAs. Clean this up.
-        if all(candles.iloc[0].isna()):
-            candles.drop(candles.index[0], inplace=True)
-        if all(candles.iloc[-1].isna()):
-            candles.drop(candles.index[-1], inplace=True)
+        # candle period - this results in a oneliner of NAs. Clean this up
+        # on the raw rows (one vectorized isnan each, no Series wrap) and
+        # trim with iloc slices rather than drop() on unsorted MultiIndex
+        # columns
+        arr = candles.to_numpy()
+        if np.isnan(arr[0]).all():
+            candles = candles.iloc[1:]
+        if np.isnan(arr[-1]).all():
+            candles = candles.iloc[:-1]
 
         return candles
 
@@ -731,29 +996,22 @@ class DXLink():
         fromTimeEpoch = int(fromTime.timestamp() * 1000)
         requestTimeEpoch = int(datetime.datetime.now(datetime.UTC).timestamp() * 1000)   # only available up until "now"
 
-        # get next odd channel available, use lock to make sure no other
-        # threads request same channels
-        with self._channelLock:
+        # next three odd channels for mark, bid, and ask
+        # why alternating? unclear - suspect server side reserves
+        # nearby channels for comms back to us
+        newChannels = [next(self._nextChannel) for _ in range(3)]
 
-            lastChannel = max(*self._candles.keys(), *self._streams.keys())
-            
-            # dxlink requires odd channels
-            if lastChannel % 2 == 0:
-                startChannel = lastChannel + 1
-            else:
-                startChannel = lastChannel + 2
+        # create containers to receive channel feeds - row counts are
+        # known from the span and time range, so each buffer is
+        # preallocated and written by cursor ([buffer, cursor] pairs)
+        numCandles = int((requestTimeEpoch - fromTimeEpoch) / _span_ms(span)) + 1
 
-            # set alternating channels for mark, bid, and ask
-            # why alternating? unclear - suspect server side reserves 
-            # nearby channels for comms back to us
-            newChannels = [startChannel, startChannel + 2, startChannel + 4]
-            
-            # create containers to receive channel feeds
-            prices = ["bid", "mark", "ask"]
-            i = 0
-            for channel in newChannels:
-                self._candles[channel] = {(symbol, prices[i], fromTimeEpoch, requestTimeEpoch) : []}
-                i += 1
+        prices = ["bid", "mark", "ask"]
+        i = 0
+        for channel in newChannels:
+            self._candles[channel] = {(symbol, prices[i], fromTimeEpoch, requestTimeEpoch) : [np.empty((numCandles, 5)), 0]}
+            self._candleEvents[channel] = asyncio.Event()
+            i += 1
 
         # request 3 new channels
         complete = await self._request_channel(newChannels)
@@ -777,13 +1035,12 @@ class DXLink():
                       "symbol" : target, 
                       "fromTime": fromTimeEpoch}
             
-            candleRequest = json.dumps({"type": "FEED_SUBSCRIPTION",
+            candleRequest = orjson.dumps({"type": "FEED_SUBSCRIPTION",
                                         "channel": j,
-                                        "add": [candle]})
-            
-            closeRequest = json.dumps({"type": "CHANNEL_CANCEL",
-                                       "channel": j})
-            
+                                        "add": [candle]}).decode()
+
+            closeRequest = _CHANNEL_CANCEL_TMPL % j
+
             candleRequests.append(candleRequest)
             closeRequests.append(closeRequest)
 
@@ -805,20 +1062,35 @@ class DXLink():
         # a "one-time-use", and simply flushing data afterwards to preserve memory
         for channel in newChannels:
             self._candles[channel] = []
+            del self._candleEvents[channel]
 
-        if candles.index[0] > candles.index[-1]:
-            candles = candles[::-1]
+        # earliest to latest - sort_index short-circuits when the concat
+        # already produced a monotonic index, so the common case is free
+        candles = candles.sort_index()
 
-        # occassionaly will struggle with one of bid, ask, or mark:
+        # occassionaly will struggle with one of bid, ask, or mark - rebuild
+        # the missing side on the raw arrays and concat on the identical
+        # index, skipping join()'s MultiIndex realignment
         found = candles.columns.get_level_values(0)
         if ("bid" not in found)  and ("ask" in found) and ("mark" in found):
-            candles = candles.join(pd.concat({"bid" : candles["mark"] * 2 - candles["ask"]}, axis=1))
+            rebuilt = candles["mark"].to_numpy() * 2 - candles["ask"].to_numpy()
+            label = "bid"
 
         elif ("ask" not in found) and ("bid" in found) and ("mark" in found):
-            candles = candles.join(pd.concat({"ask" : candles["mark"] * 2 - candles["bid"]}, axis=1))
+            rebuilt = candles["mark"].to_numpy() * 2 - candles["bid"].to_numpy()
+            label = "ask"
 
         elif ("mark" not in found) and ("ask" in found) and ("bid" in found):
-            candles = candles.join(pd.concat({"mark" : (candles["bid"] + candles["ask"]) / 2}, axis=1))
+            rebuilt = (candles["bid"].to_numpy() + candles["ask"].to_numpy()) / 2
+            label = "mark"
+
+        else:
+            rebuilt = None
+
+        if rebuilt is not None:
+            columns = pd.MultiIndex(levels=[[label], list(_OHLC)], codes=_OHLC_CODES)
+            additionals = pd.DataFrame(rebuilt, index=candles.index, columns=columns)
+            candles = pd.concat([candles, additionals], axis=1, copy=False)
 
         ### daily  adjustments, DXLink handles timezones poorly:
         # adjust index alignment to standard trading hours (0930 CST)
@@ -826,14 +1098,19 @@ class DXLink():
             if regular:
                 candles.index = candles.index + datetime.timedelta(hours=8, minutes=30)
             
-            # otherwise extended hours, adjust back to midnight UTC
+            # otherwise extended hours, adjust back to midnight UTC -
+            # normalize() floors the whole DatetimeIndex in one vectorized
+            # pass and keeps the native datetime64 dtype
             else:
-                newIndex = []
-                for i in candles.index:
-                    newIndex.append(i.replace(hour=0))
-                candles.index = newIndex
+                candles.index = candles.index.normalize()
+
+        # frames are assembled bid / ask / mark already - only a rebuilt
+        # side (appended last) needs the level-0 reindex fast path, which
+        # avoids list-__getitem__'s MultiIndex.get_indexer slow path
+        if rebuilt is not None:
+            candles = candles.reindex(columns=["bid", "ask", "mark"], level=0)
 
-        return candles[["bid", "ask", "mark"]]
+        return candles
     
     def candles(self, symbol : str, span : str, fromTime : datetime.datetime, regular : bool) -> concurrent.futures.Future:
         '''
@@ -882,7 +1159,55 @@ class DXLink():
         '''
 
         return asyncio.run_coroutine_threadsafe(self._get_candles(symbol, span, fromTime, regular), self._loop)
- 
+
+    async def _get_candles_many(self, requests : list[tuple]) -> list[pd.DataFrame]:
+        '''
+
+        Runs multiple `_get_candles()` requests concurrently on the event loop.
+
+
+        Parameters
+        ----------
+        `requests` : list[tuple]
+            One `(symbol, span, fromTime, regular)` tuple per request, with
+            fields as documented in `candles()`.
+
+        Returns
+        -------
+        `list[pd.DataFrame]`
+            One DataFrame of candles per request, in request order.
+
+        '''
+
+        return await asyncio.gather(*[self._get_candles(*request) for request in requests])
+
+    def candles_many(self, requests : list[tuple]) -> concurrent.futures.Future:
+        '''
+
+        Retreives candlestick data for multiple requests at once. All requests
+        are handed to the event loop in a single cross-thread scheduling
+        operation (one loop wake-up, one `Future`) and their subscriptions run
+        concurrently, so a burst of N requests doesn't pay the
+        `run_coroutine_threadsafe` handoff N times.
+
+
+        Parameters
+        ----------
+        `requests` : list[tuple]
+            One `(symbol, span, fromTime, regular)` tuple per request, with
+            fields as documented in `candles()`.
+
+        Returns
+        -------
+       `concurrent.futures.Future` : obj
+            The requests' historic candlestick data represented as a single
+            `Future` object. Access results via `*.result()`, which returns
+            one `pd.DataFrame` per request, in request order.
+
+        '''
+
+        return asyncio.run_coroutine_threadsafe(self._get_candles_many(requests), self._loop)
+
     async def _start_stream(self, symbol : str | list[str]) -> Stream:
         '''
         
@@ -901,20 +1226,12 @@ class DXLink():
         
         '''
         
-        # utilize lock to prevent duplicate channel requests
-        with self._channelLock:
+        # get next available odd channel - no lock needed, next() on the
+        # shared counter can't hand out duplicates
+        newChannel = next(self._nextChannel)
 
-            # get next available channel
-            lastChannel = max(*self._candles.keys(), *self._streams.keys())
-            
-            # dxlink requires odd channels
-            if lastChannel % 2 == 0:
-                newChannel = lastChannel + 1
-            else:
-                newChannel = lastChannel + 2
-
-            # create container to receive channel feed
-            self._streams[newChannel] = {}
+        # create container to receive channel feed
+        self._streams[newChannel] = _QuoteBuffer()
 
         # request new channel
         await self._request_channel(newChannel)
@@ -939,16 +1256,15 @@ class DXLink():
                 streamRequest = [{"type" : "Trade",
                                 "symbol" : symbol}]
 
-        feedRequest = json.dumps({"type": "FEED_SUBSCRIPTION",
+        feedRequest = orjson.dumps({"type": "FEED_SUBSCRIPTION",
                                   "channel": newChannel,
-                                  "add": streamRequest})
+                                  "add": streamRequest}).decode()
         
         await self._sync_send(feedRequest)
 
 
         # craft close request to be used for whenever stream is no longer needed
-        closeRequest = json.dumps({"type": "CHANNEL_CANCEL",
-                                   "channel": newChannel})
+        closeRequest = _CHANNEL_CANCEL_TMPL % newChannel
 
         # create streamer        
         stream = Stream(self, newChannel, closeRequest)
@@ -1005,8 +1321,15 @@ class DXLink():
         for task in tasks:
             task.cancel()
 
-        # wait for loop to iterate over each task (cancel() flags tasks, loop needs to see it to cancel)
-        await asyncio.sleep(2)
+        # wait for every task to actually observe its cancellation (with a
+        # hard 2s ceiling) rather than sleeping a fixed 2s - the typical
+        # case completes within one loop iteration
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True),
+                                   timeout=2)
+
+        except asyncio.TimeoutError:
+            pass
 
         return None
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from threading import Thread
+from concurrent.futures import ProcessPoolExecutor
 import datetime
+import os
 import pandas as pd
 from matplotlib.backends.backend_pdf import PdfPages
 from threading import Thread
@@ -8,7 +10,279 @@ import matplotlib as mpl
 import matplotlib.style as mplstyle
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy import stats
+
+try:
+    from numba import njit
+    NUMBA = True
+
+except ImportError:
+    NUMBA = False
+
+try:
+    from pypdf import PdfWriter
+    PYPDF = True
+
+except ImportError:
+    PYPDF = False
+
+# slippage estimate ranges per pair
+_slipEstimates = {
+            #''' Major Pairs '''
+            "USD_JPY" : {"lowVol" : np.arange(0.001, 0.0051, .0001),       "highVol" : np.arange(.01, .031, .0001)},
+            "USD_CAD" : {"lowVol" : np.arange(0.00002, 0.000071, .000001), "highVol" : np.arange(.0001, .00041, .000001)},
+            "USD_CHF" : {"lowVol" : np.arange(0.00002, 0.000071, .000001), "highVol" : np.arange(.0001, .00041, .000001)},
+            "NZD_USD" : {"lowVol" : np.arange(0.00003, 0.000081, .000001), "highVol" : np.arange(.0001, .00051, .000001)},
+            "GBP_USD" : {"lowVol" : np.arange(0.00002, 0.000061, .000001), "highVol" : np.arange(.0001, .00031, .000001)},
+            "EUR_USD" : {"lowVol" : np.arange(0.00001, 0.000051, .000001), "highVol" : np.arange(.0001, .00031, .000001)},
+
+            #''' Minor Pairs '''
+            "USD_DKK" : {"lowVol" : np.arange(0.0001, .0003, .000001),    "highVol" : np.arange(.0005, .0015, .000001)},
+            "GBP_AUD" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
+            "GBP_CAD" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
+            "GBP_CHF" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
+            "GBP_NZD" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
+            "GBP_SGD" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
+            "EUR_NOK" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "EUR_NZD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "EUR_PLN" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "EUR_SEK" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "EUR_SGD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "AUD_NZD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "AUD_SGD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "AUD_USD" : {"lowVol" : np.arange(0.00002, .000061, .000001), "highVol" : np.arange(.0001, .00041, .000001)},
+            "CAD_SGD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "SGD_CHF" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "NZD_CAD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "NZD_SGD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "NZD_CHF" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "GBP_ZAR" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "EUR_GBP" : {"lowVol" : np.arange(0.00005, .00011, .000001),  "highVol" : np.arange(.0002, .00051, .000001)},
+            "NZD_JPY" : {"lowVol" : np.arange(0.007, .0121, .0001),       "highVol" : np.arange(.03, .061, .0001)},
+            "GBP_JPY" : {"lowVol" : np.arange(0.007, .0121, .0001),       "highVol" : np.arange(.03, .061, .0001)},
+            "EUR_JPY" : {"lowVol" : np.arange(0.005, .011, .0001),        "highVol" : np.arange(.02, .051, .0001)},
+            "CHF_JPY" : {"lowVol" : np.arange(0.007, .0131, .0001),       "highVol" : np.arange(.03, .071, .0001)},
+            "CAD_JPY" : {"lowVol" : np.arange(0.008, .0131, .0001),       "highVol" : np.arange(.03, .071, .0001)},
+            "AUD_JPY" : {"lowVol" : np.arange(0.007, .0121, .0001),       "highVol" : np.arange(.03, .061, .0001)},
+            "SGD_JPY" : {"lowVol" : np.arange(0.008, .0131, .0001),       "highVol" : np.arange(.03, .071, .0001)},
+
+            # ''' Exotic Pairs '''
+            "GBP_PLN" : {"lowVol" : np.arange(.0005, .001, .000001),          "highVol" : np.arange(.002, .005, .000001)},
+            "USD_HUF" : {"lowVol" : np.arange(.01, .031, .0001),          "highVol" : np.arange(.05, .151, .0001)},
+            "USD_SGD" : {"lowVol" : np.arange(0.00008, .00021, .000001),  "highVol" : np.arange(.0004, .0011, .000001)},
+            "EUR_HUF" : {"lowVol" : np.arange(.01, .031, .0001),          "highVol" : np.arange(.05, .151, .0001)},
+            "ZAR_JPY" : {"lowVol" : np.arange(.01, .031, .0001),          "highVol" : np.arange(.05, .151, .0001)},
+            "USD_MXN" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "USD_NOK" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "USD_PLN" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "USD_SEK" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "USD_THB" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "USD_ZAR" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "USD_CNH" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "USD_CZK" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "EUR_ZAR" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "CHF_ZAR" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "EUR_CZK" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
+            "EUR_AUD" : {"lowVol" : np.arange(0.00005, .00011, .000001),  "highVol" : np.arange(.0002, .00061, .000001)},
+            "EUR_CAD" : {"lowVol" : np.arange(0.00005, .00011, .000001),  "highVol" : np.arange(.0002, .00061, .000001)},
+            "EUR_CHF" : {"lowVol" : np.arange(0.00006, .00011, .000001),  "highVol" : np.arange(.0002, .00051, .000001)},
+            "CAD_CHF" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "AUD_CHF" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
+            "AUD_CAD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)}
+           }
+
+# packed slippage tables - one contiguous float32 row per pair instead of
+# ~120 scattered float64 aranges, with real row lengths kept alongside so
+# lookups slice a view of just the populated cells
+_PAIR_IDX = {pair : i for i, pair in enumerate(_slipEstimates)}
+
+def _pack_slip_tables() -> tuple:
+
+    lows = [spec["lowVol"] for spec in _slipEstimates.values()]
+    highs = [spec["highVol"] for spec in _slipEstimates.values()]
+    width = max(max(a.size for a in lows), max(a.size for a in highs))
+
+    low = np.zeros((len(lows), width), dtype=np.float32)
+    high = np.zeros((len(highs), width), dtype=np.float32)
+    lowLen = np.empty(len(lows), dtype=np.int64)
+    highLen = np.empty(len(highs), dtype=np.int64)
+
+    for i, a in enumerate(lows):
+        low[i, :a.size] = a
+        lowLen[i] = a.size
+
+    for i, a in enumerate(highs):
+        high[i, :a.size] = a
+        highLen[i] = a.size
+
+    return low, lowLen, high, highLen
+
+_SLIP_LOW, _SLIP_LOW_LEN, _SLIP_HIGH, _SLIP_HIGH_LEN = _pack_slip_tables()
+
+def _pct_of_score(sortedVals : np.ndarray, score : float) -> float:
+    '''
+
+    `scipy.stats.percentileofscore` (kind="rank") against a pre-sorted array:
+    two bisections instead of two full passes over the values.
+
+
+    Parameters
+    ----------
+    `sortedVals` : np.ndarray
+        The population to rank against, sorted ascending.
+
+    `score` : float
+        The value to rank.
+
+    Returns
+    -------
+    `float`
+        The percentile rank of `score` within `sortedVals` (0 - 100).
+
+    '''
+
+    left = np.searchsorted(sortedVals, score, side="left")
+    right = np.searchsorted(sortedVals, score, side="right")
+    tie = 1 if right > left else 0
+
+    return (left + right + tie) * 50.0 / sortedVals.size
+
+def _slip_lookup(spread : float,
+                 volPivot : float,
+                 lowVolSorted : np.ndarray,
+                 highVolSorted : np.ndarray,
+                 lowSlip : np.ndarray,
+                 highSlip : np.ndarray) -> float:
+    '''
+
+    Maps a bid-ask spread to a slippage estimate: pick the volatility regime,
+    rank the spread within that regime's historic spreads, then pull the
+    matching percentile out of the pair's slippage table (linear-interpolated,
+    same as `np.percentile`). Plain scalar math so numba can compile the whole
+    per-trade lookup to one tight function call.
+
+
+    Parameters
+    ----------
+    `spread` : float
+        The bid-ask spread of the bar the order fills on.
+
+    `volPivot` : float
+        The spread level that splits "low" from "high" volatility.
+
+    `lowVolSorted` : np.ndarray
+        Historic low-volatility spreads, sorted ascending.
+
+    `highVolSorted` : np.ndarray
+        Historic high-volatility spreads, sorted ascending.
+
+    `lowSlip` : np.ndarray
+        The pair's low-volatility slippage table.
+
+    `highSlip` : np.ndarray
+        The pair's high-volatility slippage table.
+
+    Returns
+    -------
+    `float`
+        The estimated slippage for the order.
+
+    '''
+
+    if spread < volPivot:
+        percentile = _pct_of_score(lowVolSorted, spread)
+        table = lowSlip
+
+    else:
+        percentile = _pct_of_score(highVolSorted, spread)
+        table = highSlip
+
+    # truncate to two decimals (matches the old rounding) - an int cast
+    # instead of a float floordiv, percentile is never negative here
+    percentile = int(percentile * 100) * 0.01
+
+    # linear-interpolated percentile over the slippage table
+    rank = percentile / 100.0 * (table.size - 1)
+    lo = int(rank)
+
+    if lo + 1 < table.size:
+        return table[lo] + (table[lo + 1] - table[lo]) * (rank - lo)
+
+    return table[lo]
+
+def _subreturns_kernel(closes : np.ndarray,
+                       entryPrice : float,
+                       exitPrice : float,
+                       size : float,
+                       margin : float,
+                       isLong : bool) -> np.ndarray:
+    '''
+
+    Numeric core of `Trade._get_subreturns()`: one scalar pass over the
+    trade's closes computing each period's compounded P/L against margin.
+    Written as a plain loop so numba can compile it - for the short trades
+    backtests mostly produce, a jitted loop beats even vectorized numpy
+    (no per-ufunc dispatch or temporaries).
+
+
+    Parameters
+    ----------
+    `closes` : np.ndarray
+        The trade's per-period closes ("c_bid" for longs, "c_ask" for shorts).
+
+    `entryPrice` : float
+        The entry "fill price" of the trade.
+
+    `exitPrice` : float
+        The exit "fill price" of the trade.
+
+    `size` : float
+        The position size of the trade.
+
+    `margin` : float
+        Capital used to enter the position.
+
+    `isLong` : bool
+        Whether the trade is a long position.
+
+    Returns
+    -------
+    `np.ndarray`
+        The trade's per-period returns, one entry per close.
+
+    '''
+
+    n = closes.size
+    out = np.empty(n)
+
+    startVal = entryPrice
+    running = size
+
+    for i in range(n):
+
+        # each period marks to its close; the final period marks to the
+        # trade's actual exit fill
+        endVal = closes[i] if i < n - 1 else exitPrice
+
+        priceChange = (endVal - startVal) / startVal
+
+        if isLong:
+            newSize = running * (1.0 + priceChange)
+        else:
+            newSize = running * (1.0 - priceChange)
+
+        # per-period P/L as measured by capital (margin) put up
+        out[i] = (newSize - running) / margin
+
+        # next period's returns are measured as if never actually sold
+        startVal = closes[i]
+        running = newSize
+
+    return out
+
+if NUMBA:
+    _pct_of_score = njit(cache=True, fastmath=True)(_pct_of_score)
+    _slip_lookup = njit(cache=True, fastmath=True)(_slip_lookup)
+    _subreturns_kernel = njit(cache=True, fastmath=True)(_subreturns_kernel)
 
 class Trade():
     '''
@@ -88,78 +362,31 @@ class Trade():
 
     '''
 
+    # compact fixed-layout instances - backtests create a lot of these
+    __slots__ = ("isOpen", "tradeType", "entryPrice", "exitPrice", "stopLoss",
+                 "takeProfit", "entryIndex", "exitIndex", "age", "margin",
+                 "leverage", "size", "pl", "ret", "priceChange", "avgRets",
+                 "history", "subreturns", "_entryPos", "_exitPos")
+
     # backtest data
     _data = None
 
-    # slippage attributes
-    _slipEstimates = {
-            #''' Major Pairs '''
-            "USD_JPY" : {"lowVol" : np.arange(0.001, 0.0051, .0001),       "highVol" : np.arange(.01, .031, .0001)},
-            "USD_CAD" : {"lowVol" : np.arange(0.00002, 0.000071, .000001), "highVol" : np.arange(.0001, .00041, .000001)},
-            "USD_CHF" : {"lowVol" : np.arange(0.00002, 0.000071, .000001), "highVol" : np.arange(.0001, .00041, .000001)},
-            "NZD_USD" : {"lowVol" : np.arange(0.00003, 0.000081, .000001), "highVol" : np.arange(.0001, .00051, .000001)},
-            "GBP_USD" : {"lowVol" : np.arange(0.00002, 0.000061, .000001), "highVol" : np.arange(.0001, .00031, .000001)},
-            "EUR_USD" : {"lowVol" : np.arange(0.00001, 0.000051, .000001), "highVol" : np.arange(.0001, .00031, .000001)},
-
-            #''' Minor Pairs '''
-            "USD_DKK" : {"lowVol" : np.arange(0.0001, .0003, .000001),    "highVol" : np.arange(.0005, .0015, .000001)},
-            "GBP_AUD" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
-            "GBP_CAD" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
-            "GBP_CHF" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
-            "GBP_NZD" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
-            "GBP_SGD" : {"lowVol" : np.arange(0.00009, .000141, .000001), "highVol" : np.arange(.0004, .00071, .000001)},
-            "EUR_NOK" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "EUR_NZD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "EUR_PLN" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "EUR_SEK" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "EUR_SGD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "AUD_NZD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "AUD_SGD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "AUD_USD" : {"lowVol" : np.arange(0.00002, .000061, .000001), "highVol" : np.arange(.0001, .00041, .000001)},
-            "CAD_SGD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "SGD_CHF" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "NZD_CAD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "NZD_SGD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "NZD_CHF" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "GBP_ZAR" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "EUR_GBP" : {"lowVol" : np.arange(0.00005, .00011, .000001),  "highVol" : np.arange(.0002, .00051, .000001)},
-            "NZD_JPY" : {"lowVol" : np.arange(0.007, .0121, .0001),       "highVol" : np.arange(.03, .061, .0001)},
-            "GBP_JPY" : {"lowVol" : np.arange(0.007, .0121, .0001),       "highVol" : np.arange(.03, .061, .0001)},
-            "EUR_JPY" : {"lowVol" : np.arange(0.005, .011, .0001),        "highVol" : np.arange(.02, .051, .0001)},
-            "CHF_JPY" : {"lowVol" : np.arange(0.007, .0131, .0001),       "highVol" : np.arange(.03, .071, .0001)},
-            "CAD_JPY" : {"lowVol" : np.arange(0.008, .0131, .0001),       "highVol" : np.arange(.03, .071, .0001)},
-            "AUD_JPY" : {"lowVol" : np.arange(0.007, .0121, .0001),       "highVol" : np.arange(.03, .061, .0001)},
-            "SGD_JPY" : {"lowVol" : np.arange(0.008, .0131, .0001),       "highVol" : np.arange(.03, .071, .0001)},
-
-            # ''' Exotic Pairs '''
-            "GBP_PLN" : {"lowVol" : np.arange(.0005, .001, .000001),          "highVol" : np.arange(.002, .005, .000001)},
-            "USD_HUF" : {"lowVol" : np.arange(.01, .031, .0001),          "highVol" : np.arange(.05, .151, .0001)},
-            "USD_SGD" : {"lowVol" : np.arange(0.00008, .00021, .000001),  "highVol" : np.arange(.0004, .0011, .000001)},
-            "EUR_HUF" : {"lowVol" : np.arange(.01, .031, .0001),          "highVol" : np.arange(.05, .151, .0001)},
-            "ZAR_JPY" : {"lowVol" : np.arange(.01, .031, .0001),          "highVol" : np.arange(.05, .151, .0001)},
-            "USD_MXN" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "USD_NOK" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "USD_PLN" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "USD_SEK" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "USD_THB" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "USD_ZAR" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "USD_CNH" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "USD_CZK" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "EUR_ZAR" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "CHF_ZAR" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "EUR_CZK" : {"lowVol" : np.arange(.0001, .00031, .000001),    "highVol" : np.arange(.0005, .00151, .000001)},
-            "EUR_AUD" : {"lowVol" : np.arange(0.00005, .00011, .000001),  "highVol" : np.arange(.0002, .00061, .000001)},
-            "EUR_CAD" : {"lowVol" : np.arange(0.00005, .00011, .000001),  "highVol" : np.arange(.0002, .00061, .000001)},
-            "EUR_CHF" : {"lowVol" : np.arange(0.00006, .00011, .000001),  "highVol" : np.arange(.0002, .00051, .000001)},
-            "CAD_CHF" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "AUD_CHF" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)},
-            "AUD_CAD" : {"lowVol" : np.arange(0.00008, .000131, .000001), "highVol" : np.arange(.0003, .00071, .000001)}
-           }
+    # cached bid-ask columns + label -> position map (skips .loc per order)
+    _o_ask = None
+    _o_bid = None
+    _c_ask = None
+    _c_bid = None
+    _h_ask = None
+    _l_bid = None
+    _pos = None
 
     _volPivot = None
     _lowVol = None
     _highVol = None
     _hlVol = None
+    _lowVolSorted = None
+    _highVolSorted = None
+    _hlVolSorted = None
     _slippage = None
 
     @classmethod
@@ -189,29 +416,49 @@ class Trade():
         # set the data
         cls._data = data
 
+        # cache the bid-ask columns as raw ndarrays and map each index label
+        # to its integer position - slippage lookups become two array reads
+        # instead of chained .loc calls (each of which hashes the index)
+        cls._o_ask = data["o_ask"].to_numpy()
+        cls._o_bid = data["o_bid"].to_numpy()
+        cls._c_ask = data["c_ask"].to_numpy()
+        cls._c_bid = data["c_bid"].to_numpy()
+        cls._h_ask = data["h_ask"].to_numpy()
+        cls._l_bid = data["l_bid"].to_numpy()
+        cls._pos = {stamp : i for i, stamp in enumerate(data.index)}
+
         ''' SLIPPAGE ESTIMATES '''
-        # calculate distance between spread
-        open_spreads = data["o_ask"] - data["o_bid"]
-        close_spreads = data["c_ask"] - data["c_bid"]
+        # calculate distance between spread - straight off the cached column
+        # arrays, no Series or Index construction
+        openSpreads = cls._o_ask - cls._o_bid
+        closeSpreads = cls._c_ask - cls._c_bid
 
         # aggregate spreads
-        all_spreads = pd.concat([open_spreads, close_spreads], axis=0)
+        allSpreads = np.concatenate([openSpreads, closeSpreads])
 
-        # set volatility point (below will be considered "low volatility" and 
-        # above will be "high volatility"
-        cls._volPivot = all_spreads.median() + all_spreads.std()
+        # set volatility point (below will be considered "low volatility" and
+        # above will be "high volatility" - ddof=1 matches Series.std()
+        cls._volPivot = float(np.median(allSpreads) + np.std(allSpreads, ddof=1))
 
-        # segregate data by volatility point - *note* only including `=` in 
-        # _lowVol to avoid percentile filtering errors, anything that is equal 
+        # segregate data by volatility point - *note* only including `=` in
+        # _lowVol to avoid percentile filtering errors, anything that is equal
         # to _volPivot will be actually classified as "high" later on
-        cls._lowVol = all_spreads[all_spreads <= cls._volPivot]
-        cls._highVol = all_spreads[all_spreads >= cls._volPivot]
+        cls._lowVol = allSpreads[allSpreads <= cls._volPivot]
+        cls._highVol = allSpreads[allSpreads >= cls._volPivot]
 
         # pull high-low spread (will used for "mid" spread multiplier)
-        cls._hlVol = data["h_ask"] - data["l_bid"]
+        cls._hlVol = cls._h_ask - cls._l_bid
+
+        # pre-sorted copies for the jitted percentile-rank lookups
+        cls._lowVolSorted = np.sort(cls._lowVol)
+        cls._highVolSorted = np.sort(cls._highVol)
+        cls._hlVolSorted = np.sort(cls._hlVol)
 
-        # pull slippage estimates
-        cls._slippage = cls._slipEstimates[target]
+        # pull slippage estimates - contiguous row views out of the packed
+        # float32 tables, no dict-of-dicts traversal per lookup
+        pair = _PAIR_IDX[target]
+        cls._slippage = (_SLIP_LOW[pair, :_SLIP_LOW_LEN[pair]],
+                         _SLIP_HIGH[pair, :_SLIP_HIGH_LEN[pair]])
 
         return None
 
@@ -271,11 +518,14 @@ class Trade():
         self.isOpen = True
         self.tradeType = tradeType
 
+        # slippage call skipped entirely on the no-slippage path
+        slippage = 0.0 if slipOn is None else self._est_slippage(entryIndex, slipOn)
+
         if tradeType == "long":
-            self.entryPrice = entryPrice + self._est_slippage(entryIndex, slipOn)
+            self.entryPrice = entryPrice + slippage
         elif tradeType == "short":
-            self.entryPrice = entryPrice - self._est_slippage(entryIndex, slipOn)
-        
+            self.entryPrice = entryPrice - slippage
+
         self.margin = margin
         self.leverage = leverage
         self.size = self.margin * (1 / self.leverage)
@@ -315,36 +565,33 @@ class Trade():
         
         if isinstance(slipOn, str):
 
+            # resolve the label once, then read from the cached column arrays
+            pos = self._pos[index]
+
             # calculate spread between bid and ask
             if slipOn == "open":
-                spread = self._data.loc[index]["o_ask"] - self._data.loc[index]["o_bid"]
+                spread = self._o_ask[pos] - self._o_bid[pos]
 
             elif slipOn == "close":
-                spread = self._data.loc[index]["c_ask"] - self._data.loc[index]["c_bid"]
+                spread = self._c_ask[pos] - self._c_bid[pos]
 
             elif slipOn == "mid":
                 # average of opening spread and closing spread
-                openSpread = self._data.loc[index]["o_ask"] - self._data.loc[index]["o_bid"]
-                closeSpread = self._data.loc[index]["c_ask"] - self._data.loc[index]["c_bid"]
+                openSpread = self._o_ask[pos] - self._o_bid[pos]
+                closeSpread = self._c_ask[pos] - self._c_bid[pos]
                 midSpread = (openSpread + closeSpread) / 2
-                
+
                 # multiplied by volatility of high / low between the open and close
                 # multiplier = percentile / 50 -> median H/L spread will only multiply by 1
-                hlSpread = self._data.loc[index]["h_ask"] - self._data.loc[index]["l_bid"]
-                multiplier = stats.percentileofscore(self._hlVol, hlSpread) / 50
+                hlSpread = self._h_ask[pos] - self._l_bid[pos]
+                multiplier = _pct_of_score(self._hlVolSorted, hlSpread) / 50
                 spread = midSpread * multiplier
 
-            # if considered "low volatility", pull percentile within low volatility
-            if spread < self._volPivot:
-                percentile = stats.percentileofscore(self._lowVol, spread)
-                percentile = (percentile * 100 // 1) / 100
-                slippage = np.percentile(self._slippage["lowVol"], percentile)
-
-            # if considered "high volatility", pull percentile within high volatility
-            else:
-                percentile = stats.percentileofscore(self._highVol, spread)
-                percentile = (percentile * 100 // 1) / 100
-                slippage = np.percentile(self._slippage["highVol"], percentile)
+            # rank the spread within its volatility regime and pull the
+            # matching slippage percentile (jitted when numba's available)
+            slippage = _slip_lookup(spread, self._volPivot,
+                                    self._lowVolSorted, self._highVolSorted,
+                                    self._slippage[0], self._slippage[1])
 
         else:
             slippage = 0
@@ -367,54 +614,26 @@ class Trade():
         
         '''
 
-        subreturns = []
-        startVal = self.entryPrice
-        size = self.size
-
+        # pull the marking closes as a view of the cached column arrays
+        # (no DataFrame column access) and hand the compounding loop to
+        # the jitted kernel - one scalar pass, no temporaries
         if self.tradeType == "long":
+            closes = self._c_bid[self._entryPos:self._exitPos + 1]
 
-            for index, row in self.history.iterrows():
-                
-                # current period's returns are projected as selling at the end of this period
-                if index != self.exitIndex:
-                    endVal = row["c_bid"]
-
-                # otherwise use final price of trade
-                else:
-                    endVal = self.exitPrice
-                
-                # returns as measured by capital (margin) put up
-                priceChange = (endVal - startVal) / startVal
-                newSize = size * (1 + priceChange)
-                pl = newSize - size
-                subreturns.append(pl / self.margin)
-                
-                # next period's returns are measured as if never actually sold this period
-                startVal = row["c_bid"]
-                size = newSize
-
-        # repeat the above process, but for short trades:
         elif self.tradeType == "short":
+            closes = self._c_ask[self._entryPos:self._exitPos + 1]
 
-            for index, row in self.history.iterrows():
-            
-                if index != self.exitIndex:
-                    endVal = row["c_ask"]
-            
-                else:
-                    endVal = self.exitPrice
-                
-                priceChange = (endVal - startVal) / startVal
-                newSize = size * (1 + (-1) * priceChange)
-                pl = newSize - size
-                subreturns.append(pl / self.margin)
-
-                # next period's returns are measured as if never actually sold this period
-                startVal = row["c_ask"]
-                size = newSize
+        # read each attribute once and pin the kernel arguments to bare
+        # doubles (margin / size may arrive as ints, which would otherwise
+        # specialize the jit on mixed signatures)
+        subreturns = _subreturns_kernel(closes, float(self.entryPrice),
+                                        float(self.exitPrice),
+                                        float(self.size),
+                                        float(self.margin),
+                                        self.tradeType == "long")
 
         # index by history
-        indexed_subreturns = pd.DataFrame({"subreturns" : subreturns}, 
+        indexed_subreturns = pd.DataFrame({"subreturns" : subreturns},
                                            index=self.history.index)
 
         return indexed_subreturns
@@ -520,26 +739,140 @@ class Trade():
         self.exitIndex = exitIndex
         self.age = self.exitIndex - self.entryIndex
 
-        # calculate the P/L
+        # calculate the P/L - entry price read once, into a local, and the
+        # slippage call skipped entirely on the no-slippage (take profit) path
+        entryPrice = self.entryPrice
+        slippage = 0.0 if slipOn is None else self._est_slippage(exitIndex, slipOn)
+
         if self.tradeType == "long":
-            self.exitPrice = exitPrice - self._est_slippage(exitIndex, slipOn)
-            self.priceChange = (self.exitPrice - self.entryPrice) / self.entryPrice
+            self.exitPrice = exitPrice - slippage
+            self.priceChange = (self.exitPrice - entryPrice) / entryPrice
             self.pl = self.size * self.priceChange
 
         elif self.tradeType == "short":
-            self.exitPrice = exitPrice + self._est_slippage(exitIndex, slipOn)
-            self.priceChange = (self.exitPrice - self.entryPrice) / self.entryPrice
+            self.exitPrice = exitPrice + slippage
+            self.priceChange = (self.exitPrice - entryPrice) / entryPrice
             self.pl = self.size * (-1) * self.priceChange
 
         self.ret = self.pl / self.margin
 
-        # slice historic: `.loc[]` IS inclusive of end index, iloc IS NOT!
-        self.history = self._data.loc[self.entryIndex:self.exitIndex]
-        
+        # slice historic by position - _pos resolves both labels O(1) and
+        # iloc hands back a pure view, no index bisection (*note* iloc is
+        # NOT inclusive of the end position, hence the +1)
+        self._entryPos = self._pos[self.entryIndex]
+        self._exitPos = self._pos[self.exitIndex]
+        self.history = self._data.iloc[self._entryPos:self._exitPos + 1]
+
         self.subreturns = self._get_subreturns()
 
         return None
-    
+
+    @classmethod
+    def close_batch(cls,
+                    trades : list[Trade],
+                    exitPrices : list[float],
+                    exitIndices : list[datetime.datetime],
+                    slipOn : str | None = None) -> None:
+        '''
+
+        Closes many trades at once. Equivalent to calling `close()` on each
+        trade, but the bookkeeping is batched: every exit label resolves to
+        its integer position up front and the slippage spreads come off the
+        cached column arrays in one vectorized read, so only the per-trade
+        compounding (already jitted) and attribute writes remain in the loop.
+
+
+        Parameters
+        ----------
+        `trades` : list[Trade]
+            The open trades to close.
+
+        `exitPrices` : list[float]
+            The exit price of each trade, aligned with `trades`.
+
+        `exitIndices` : list[datetime.datetime]
+            Each trade's final index within the historic data used for
+            testing, aligned with `trades`.
+
+        `slipOn` : str | None = None
+            Whether to apply slippage to the orders. Slippaged applied is
+            based on the volatility of each `exitIndex`'s open or close
+            spread: ["open", "close"]
+            *note* for "take profit" orders leave `slipOn=None`, "take profit"
+            orders do not incur negative slippage.
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        exits = np.asarray(exitPrices, dtype=np.float64)
+
+        # resolve all exit labels to integer positions up front
+        positions = np.fromiter((cls._pos[stamp] for stamp in exitIndices),
+                                dtype=np.int64, count=len(exitIndices))
+
+        # batched slippage spreads, straight off the cached column arrays
+        if slipOn == "open":
+            spreads = cls._o_ask[positions] - cls._o_bid[positions]
+
+        elif slipOn == "close":
+            spreads = cls._c_ask[positions] - cls._c_bid[positions]
+
+        elif slipOn == "mid":
+            midSpreads = ((cls._o_ask[positions] - cls._o_bid[positions]) +
+                          (cls._c_ask[positions] - cls._c_bid[positions])) / 2
+
+            hlSpreads = cls._h_ask[positions] - cls._l_bid[positions]
+
+            multipliers = np.empty_like(hlSpreads)
+            for i in range(hlSpreads.size):
+                multipliers[i] = _pct_of_score(cls._hlVolSorted, hlSpreads[i]) / 50
+
+            spreads = midSpreads * multipliers
+
+        else:
+            spreads = None
+
+        # write results back per trade - jitted kernels and attribute
+        # stores only, no label-based pandas work left in the loop
+        for i, trade in enumerate(trades):
+
+            if spreads is None:
+                slippage = 0
+
+            else:
+                slippage = _slip_lookup(spreads[i], cls._volPivot,
+                                        cls._lowVolSorted, cls._highVolSorted,
+                                        cls._slippage[0], cls._slippage[1])
+
+            trade.isOpen = False
+            trade.exitIndex = exitIndices[i]
+            trade.age = trade.exitIndex - trade.entryIndex
+
+            if trade.tradeType == "long":
+                trade.exitPrice = exits[i] - slippage
+                trade.priceChange = (trade.exitPrice - trade.entryPrice) / trade.entryPrice
+                trade.pl = trade.size * trade.priceChange
+
+            elif trade.tradeType == "short":
+                trade.exitPrice = exits[i] + slippage
+                trade.priceChange = (trade.exitPrice - trade.entryPrice) / trade.entryPrice
+                trade.pl = trade.size * (-1) * trade.priceChange
+
+            trade.ret = trade.pl / trade.margin
+
+            # slice historic by position (*note* iloc is NOT inclusive of
+            # the end position, hence the +1)
+            trade._entryPos = cls._pos[trade.entryIndex]
+            trade._exitPos = positions[i]
+            trade.history = cls._data.iloc[trade._entryPos:trade._exitPos + 1]
+
+            trade.subreturns = trade._get_subreturns()
+
+        return None
+
     def get_stats(self) -> None:
         '''
         
@@ -570,39 +903,38 @@ class Trade():
 
         return None
     
-def _saveTrades(trades : list[Trade],
-                outfile : str,
-                columns : list[str] | None = None) -> None:
+def _render_chunk(trades : list[Trade],
+                  outfile : str,
+                  columns : list[str] | None = None) -> None:
     '''
-    
-    Given a list of Trade() objects, create a single PDF with each trade's
-    history saved to its own page.
+
+    Renders one PDF with each trade's history on its own page - the
+    per-process worker behind `_saveTrades()`.
 
 
     Parameters
     ----------
     `trades` : list
-        List of `Trade()` objects to save.
-    
+        List of `Trade()` objects to render.
+
     `outfile` : str
         Full path to pdf file (name and `.pdf` extention included).
 
     `columns` : list[str] | None = None
         Columns within the trade's history to chart - the index will always
-        be used for the x-axis, but the y-axis may be selected on a 
+        be used for the x-axis, but the y-axis may be selected on a
         column-by-column basis:
             exp: columns=["c", "sma"]
-    
+
     Returns
     -------
     `None`
-    
-    '''
 
-    # record start time
-    startTime = datetime.datetime.now()
+    '''
 
-    # set speed optimization
+    # set speed optimization - once, up front (the style is idempotent, no
+    # point re-applying it per page)
+    mplstyle.use('fast')                            # optimizes additional configs for plotting
     mpl.rcParams['path.simplify'] = True            # whether to simplify
     mpl.rcParams['path.simplify_threshold'] = 1.0   # how much to simplify
     mpl.rcParams['agg.path.chunksize'] = 10000      # breaking up lines into chunks
@@ -611,30 +943,110 @@ def _saveTrades(trades : list[Trade],
     fig, axes = plt.subplots()
     plt.tight_layout()
 
+    # one persistent Line2D per charted column - pages just swap the line
+    # data and rescale instead of rebuilding artists and axes every trade
+    lines = []
+
     with PdfPages(outfile) as pdf:
 
         # for each trade
         for trade in trades:
 
-            # plot the chart
+            x = trade.history.index.to_numpy()
+
             if columns:
-                axes.plot(trade.history.index.to_numpy(),
-                          trade.history[columns])
+                y = trade.history[columns].to_numpy()
 
             else:
-                axes.plot(trade.history.index.to_numpy(),
-                          trade.history)
+                y = trade.history.to_numpy()
+
+            # (re)build the artists only if the column count changes
+            if len(lines) != y.shape[1]:
+                axes.clear()
+                lines = [axes.plot([], [])[0] for _ in range(y.shape[1])]
+
+            for i, line in enumerate(lines):
+                line.set_data(x, y[:, i])
 
-            mplstyle.use('fast')                        # optimizes additional configs for plotting
+            axes.relim()
+            axes.autoscale_view()
 
             # write the page
             pdf.savefig(fig)
 
-            # clear the current axes
-            axes.clear()
-
     plt.close()
 
+    return None
+
+def _saveTrades(trades : list[Trade],
+                outfile : str,
+                columns : list[str] | None = None) -> None:
+    '''
+
+    Given a list of Trade() objects, create a single PDF with each trade's
+    history saved to its own page. Page rendering is embarrassingly parallel
+    per trade, so with `pypdf` available the trades are rendered as
+    contiguous chunks in worker processes and the partial PDFs stitched back
+    together in order - otherwise everything renders in this process.
+
+
+    Parameters
+    ----------
+    `trades` : list
+        List of `Trade()` objects to save.
+
+    `outfile` : str
+        Full path to pdf file (name and `.pdf` extention included).
+
+    `columns` : list[str] | None = None
+        Columns within the trade's history to chart - the index will always
+        be used for the x-axis, but the y-axis may be selected on a
+        column-by-column basis:
+            exp: columns=["c", "sma"]
+
+    Returns
+    -------
+    `None`
+
+    '''
+
+    # record start time
+    startTime = datetime.datetime.now()
+
+    workers = os.cpu_count() or 1
+
+    # parallel render - contiguous chunks keep the final page order
+    if PYPDF and workers > 1 and len(trades) > workers:
+
+        chunkSize = -(-len(trades) // workers)      # ceiling division
+        chunks = [trades[i : i + chunkSize] for i in range(0, len(trades), chunkSize)]
+        parts = ["{}.part{}".format(outfile, i) for i in range(len(chunks))]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = [executor.submit(_render_chunk, chunk, part, columns)
+                    for chunk, part in zip(chunks, parts)]
+
+            # surface any worker failure
+            for job in jobs:
+                job.result()
+
+        # stitch the partial PDFs back together in order
+        merged = PdfWriter()
+        for part in parts:
+            merged.append(part)
+
+        with open(outfile, "wb") as file:
+            merged.write(file)
+
+        merged.close()
+
+        for part in parts:
+            os.remove(part)
+
+    # serial render - no pypdf to stitch with (or nothing to gain)
+    else:
+        _render_chunk(trades, outfile, columns)
+
     # record end time
     endTime = datetime.datetime.now()
 
@@ -1,13 +1,44 @@
 import requests
 import datetime
-import copy
+import functools
+import re
+import orjson
 import pandas as pd
 from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor
 import time
 import json
 import sys
 
 ''' CLIENT-SERVER COMMUNICATIONS '''
+# numeric / RCF3339 string shapes, matched up front so the common
+# non-numeric case never raises (exception unwinding is expensive)
+_NUM_RE = re.compile(r"^-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?$")
+_TS_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T")
+
+def _rfc3339(stamp : datetime.datetime) -> str:
+    ''' Formats a datetime as an RFC3339 string in UTC. *Note* Times will be
+    converted to UTC prior to formatting - ensure timezones are properly
+    assigned within datetime objects if operating in a different timezone.
+
+    Parameters
+    ----------
+    `stamp` : datetime.datetime
+        The datetime to format.
+
+    Returns
+    -------
+    `str`
+        The RFC3339-formatted timestamp.
+
+    '''
+
+    stamp = stamp.astimezone(datetime.UTC).isoformat().replace("+00:00", "Z")
+    if stamp[-1] != "Z":
+        stamp = stamp + "Z"
+
+    return stamp
+
 def _to_strings(obj : dict) -> dict:
     ''' Designed for pre-formatting server requests, recursively replaces objects
     with their  string equivalents (datetime.datetime objects are formatted as 
@@ -28,21 +59,17 @@ def _to_strings(obj : dict) -> dict:
 
     '''
 
-    # recurse down list
+    # recurse down list - rebuilt fresh, the original is never touched
     if isinstance(obj, list):
-        for entry in range(0, len(obj)):
-            obj[entry] = _to_strings(obj[entry])
+        return [_to_strings(entry) for entry in obj]
 
-    # recurse down dictionary
+    # recurse down dictionary - rebuilt fresh, the original is never touched
     elif isinstance(obj, dict):
-        for key in obj:
-            obj[key] = _to_strings(obj[key])
+        return {key : _to_strings(value) for key, value in obj.items()}
 
     # check if object is a datetime (and convert / format if it is)
     elif isinstance(obj, datetime.datetime):
-        obj = obj.astimezone(datetime.UTC).isoformat().replace("+00:00", "Z")
-        if obj[-1] != "Z":
-            obj = obj + "Z"
+        obj = _rfc3339(obj)
     
     # pass over None(s)
     elif obj is None:
@@ -72,9 +99,9 @@ def to_strings(dictionary : dict) -> dict:
 
     '''
 
-    newDict = copy.deepcopy(dictionary)
-
-    return _to_strings(newDict)
+    # _to_strings() rebuilds containers as it walks, so no defensive
+    # deepcopy (a full pickling-style mirror of the payload) is needed
+    return _to_strings(dictionary)
 
 def to_objects(dictionary : dict) -> dict:
     ''' Converts eligible string values to python datatypes (does NOT throw 
@@ -96,34 +123,125 @@ def to_objects(dictionary : dict) -> dict:
     
     '''
 
-    newDict = copy.deepcopy(dictionary)
+    # values are replaced wholesale, so a shallow copy is all that's needed
+    # (as an object_hook the input is a fresh dict from json.loads anyway)
+    newDict = dict(dictionary)
 
     for key in newDict:
-        if type(newDict[key]) == str:
-            
-            # likely a float or RCF3339 time if string contains "."
-            if "." in newDict[key]:
-                # more often than not, it's a float
-                try: 
-                    newDict[key] = float(newDict[key])
-                except:
-                    # otherwise typically RCF3339 time
-                    try:
-                        newDict[key] = datetime.datetime.fromisoformat(newDict[key])
-                    # if neither, should likely remain a string
-                    except:
-                        pass
-            
-            # try converting integers, as well
-            else:
-                try: 
-                    newDict[key] = int(newDict[key])
-                except:
+        value = newDict[key]
+        if type(value) == str:
+
+            # numeric strings - the regex guarantees the conversion
+            # succeeds, so no exceptions on the common path
+            if _NUM_RE.match(value):
+                if "." in value or "e" in value or "E" in value:
+                    newDict[key] = float(value)
+                else:
+                    newDict[key] = int(value)
+
+            # otherwise typically RCF3339 time
+            elif _TS_RE.match(value):
+                try:
+                    newDict[key] = datetime.datetime.fromisoformat(value)
+                # if neither, should likely remain a string
+                except ValueError:
                     pass
 
     return newDict
 
+def _from_json_walk(obj : dict | list | str):
+    '''
+
+    Applies `to_objects()`-style conversions bottom-up over a freshly parsed
+    payload. Same result as json.loads(<data>, object_hook=to_objects), but
+    usable with parsers (orjson) that don't take an object hook.
+
+    Parameters
+    ----------
+    `obj` : dict | list | str
+        The parsed payload (or a branch of it) to convert.
+
+    Returns
+    -------
+    The payload with all eligible strings converted to objects.
+
+    '''
+
+    if isinstance(obj, dict):
+        return {key : _from_json_walk(value) for key, value in obj.items()}
+
+    elif isinstance(obj, list):
+        return [_from_json_walk(entry) for entry in obj]
+
+    elif isinstance(obj, str):
+
+        # numeric strings - the regex guarantees the conversion succeeds
+        if _NUM_RE.match(obj):
+            if "." in obj or "e" in obj or "E" in obj:
+                return float(obj)
+            return int(obj)
+
+        # otherwise typically RCF3339 time
+        elif _TS_RE.match(obj):
+            try:
+                return datetime.datetime.fromisoformat(obj)
+            except ValueError:
+                pass
+
+    return obj
+
+def from_json(payload : bytes | str) -> dict:
+    '''
+
+    Parses a server response with `orjson` (C-speed parse, no per-dict
+    object hook dispatch) and converts eligible strings to [int, float,
+    datetime.datetime] objects.
+
+    Parameters
+    ----------
+    `payload` : bytes | str
+        The raw response body.
+
+    Returns
+    -------
+    `dict`
+        The parsed response with values converted to their appropriate
+        objects.
+
+    '''
+
+    return _from_json_walk(orjson.loads(payload))
+
 ''' ENTRY ORDERS'''
+# legal enum values - checked locally so a typo fails in nanoseconds rather
+# than costing a server round-trip (and a rate-limit token) to reject
+_TIF = frozenset(("GTC", "GTD", "GFD", "FOK", "IOC"))
+_POS_FILL = frozenset(("OPEN_ONLY", "REDUCE_FIRST", "REDUCE_ONLY", "DEFAULT"))
+_TRIGGER = frozenset(("DEFAULT", "INVERSE", "BID", "ASK", "MID"))
+
+@functools.lru_cache(maxsize=128)
+def _client_ext(tag : str) -> dict:
+    '''
+
+    Returns the client extensions wrapper for a strategy tag. Recurring
+    strategies reuse one shared dict rather than allocating a fresh
+    single-entry wrapper per order - safe, since the send path only ever
+    reads payloads (`_to_strings()` rebuilds, never mutates).
+
+    Parameters
+    ----------
+    `tag` : str
+        The strategy tag associated with the order.
+
+    Returns
+    -------
+    `dict`
+        The OANDA-formatted client extensions wrapper.
+
+    '''
+
+    return {"tag" : tag}
+
 class _BaseEntry():
     '''
     
@@ -148,34 +266,96 @@ class _BaseEntry():
     
     `set_guaranteedStop()` : func
         Creates and sets entry order's GuarnateedStopLoss dependent order.
-    
+
+    `_set_dependent()` : func
+        Builds and attaches a dependent order's sub-payload - all four
+        `set_*()` methods delegate here.
+
     `get_payload()` : func
         Returns entry order's payload.
 
     '''
 
-    def __init__(self) -> None:
-        ''' Initializes BaseOrder object. 
+    __slots__ = ("payload",)
+
+    def __init__(self, otype : str | None = None) -> None:
+        ''' Initializes BaseOrder object.
 
         Parameters
         ----------
-        None
+        `otype` : str | None = None
+            The order type ("MARKET", "LIMIT", etc.), set by the subclass.
 
         Returns
         -------
         `None`
-        
+
         '''
 
-        # shared order specifications
-        self.payload = {"type" : None,
+        # shared order specifications - one literal, one allocation
+        self.payload = {"type" : otype,
                         "instrument" : None,
                         "units" : None,
                         "timeInForce" : None,
                         "positionFill" : None}
 
         return None
-    
+
+    def _set_dependent(self,
+                       field : str,
+                       price : float | None,
+                       distance : float | None,
+                       timeInForce : str,
+                       gtdTime : datetime.datetime | str | None) -> None:
+        ''' Builds and attaches a dependent order's sub-payload. All four
+        dependent order types share the same shape - only the payload key
+        differs - so the public `set_*()` methods delegate here.
+
+        Parameters
+        ----------
+        `field` : str
+            The payload key to attach the dependent order under
+            ("takeProfitOnFill", "stopLossOnFill", etc.).
+
+        `price` : float | None
+            The dependent order's price threshold - given preference over
+            `distance` when both are input.
+
+        `distance` : float | None
+            The distance (in positive price units) from the trade's current
+            price to use as the Order price.
+
+        `timeInForce` : str
+            The time-in-force requested for the Order.
+
+        `gtdTime` : datetime.datetime | str | None
+            (Required if timeInForce=GTD) The date/time when the Order will be
+            cancelled if its timeInForce is “GTD”.
+
+        Returns
+        -------
+        `None`
+
+        '''
+
+        # reject bad enums locally before they cost a round-trip
+        if timeInForce not in _TIF:
+            raise ValueError("invalid timeInForce: {!r}".format(timeInForce))
+
+        # set required specifications - price takes preference over distance
+        dependent = {"price" : price} if price else {"distance" : distance}
+
+        dependent["timeInForce"] = timeInForce
+
+        if (timeInForce == "GTD") and (gtdTime):
+            if isinstance(gtdTime, datetime.datetime):
+                gtdTime = _rfc3339(gtdTime)
+            dependent["gtdTime"] = gtdTime
+
+        self.payload[field] = dependent
+
+        return None
+
     def set_takeProfit(self,
                        price : float | None = None,
                        distance : float | None = None,
@@ -226,21 +406,8 @@ class _BaseEntry():
         
         '''
         
-        # create dependent field
-        self.payload["takeProfitOnFill"] = {}
-
-        # set required specifications
-        if price:
-            self.payload["takeProfitOnFill"]["price"] = price
-        else:
-            self.payload["takeProfitOnFill"]["distance"] = distance
-        
-        self.payload["takeProfitOnFill"]["timeInForce"] = timeInForce
-
-        if (timeInForce == "GTD") and (gtdTime):
-            self.payload["takeProfitOnFill"]["gtdTime"] = gtdTime
-
-        return None
+        return self._set_dependent("takeProfitOnFill", price, distance,
+                                   timeInForce, gtdTime)
     
     def set_stopLoss(self,
                      price : float | None = None,
@@ -292,21 +459,8 @@ class _BaseEntry():
         
         '''
         
-        # create dependent field
-        self.payload["stopLossOnFill"] = {}
-
-        # set required specifications
-        if price:
-            self.payload["stopLossOnFill"]["price"] = price
-        else:
-            self.payload["stopLossOnFill"]["distance"] = distance
-        
-        self.payload["stopLossOnFill"]["timeInForce"] = timeInForce
-
-        if (timeInForce == "GTD") and (gtdTime):
-            self.payload["stopLossOnFill"]["gtdTime"] = gtdTime
-
-        return None
+        return self._set_dependent("stopLossOnFill", price, distance,
+                                   timeInForce, gtdTime)
     
     def set_trailingStop(self,
                          distance : float,
@@ -349,18 +503,8 @@ class _BaseEntry():
         
         '''
 
-        # create dependent field
-        self.payload["trailingStopLossOnFill"] = {}
-
-        # set required specifications
-        self.payload["trailingStopLossOnFill"]["distance"] = distance
-
-        self.payload["trailingStopLossOnFill"]["timeInForce"] = timeInForce
-
-        if (timeInForce == "GTD") and (gtdTime):
-            self.payload["trailingStopLossOnFill"]["gtdTime"] = gtdTime
-
-        return None
+        return self._set_dependent("trailingStopLossOnFill", None, distance,
+                                   timeInForce, gtdTime)
     
     def set_guaranteedStop(self,
                            price : float | None = None,
@@ -410,21 +554,8 @@ class _BaseEntry():
         
         '''
         
-        # create dependent field
-        self.payload["guaranteedStopLossOnFill"] = {}
-
-        # set required specifications
-        if price:
-            self.payload["guaranteedStopLossOnFill"]["price"] = price
-        else:
-            self.payload["guaranteedStopLossOnFill"]["distance"] = distance
-        
-        self.payload["guaranteedStopLossOnFill"]["timeInForce"] = timeInForce
-
-        if (timeInForce == "GTD") and (gtdTime):
-            self.payload["guaranteedStopLossOnFill"]["gtdTime"] = gtdTime
-
-        return None
+        return self._set_dependent("guaranteedStopLossOnFill", price, distance,
+                                   timeInForce, gtdTime)
 
     def get_payload(self):
         ''' Returns entry order's payload.
@@ -456,10 +587,12 @@ class MarketOrder(_BaseEntry):
     Methods
     -------
     `set()` : func
-        Sets required Market Order specifications. 
+        Sets required Market Order specifications.
 
     '''
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         ''' 
         
@@ -476,10 +609,7 @@ class MarketOrder(_BaseEntry):
         
         '''
 
-        _BaseEntry.__init__(self)
-
-        # set Market Order type
-        self.payload["type"] = "MARKET"
+        _BaseEntry.__init__(self, "MARKET")
 
         return None
 
@@ -542,18 +672,25 @@ class MarketOrder(_BaseEntry):
         '''
 
         
-        # set required specifications
-        self.payload["instrument"] = instrument
-        self.payload["units"] = units
-        self.payload["timeInForce"] = timeInForce
-        self.payload["positionFill"] = positionFill
+        # reject bad enums locally before they cost a round-trip
+        if timeInForce not in _TIF:
+            raise ValueError("invalid timeInForce: {!r}".format(timeInForce))
+
+        if positionFill not in _POS_FILL:
+            raise ValueError("invalid positionFill: {!r}".format(positionFill))
+
+        # set required specifications - one bulk update off a single literal
+        self.payload.update({"instrument" : instrument,
+                             "units" : units,
+                             "timeInForce" : timeInForce,
+                             "positionFill" : positionFill})
 
         # set optional specifications
         if priceBounds:
             self.payload["priceBounds"] = priceBounds
 
         if strategy:
-            self.payload["tradeClientExtensions"] = {"tag" : strategy}
+            self.payload["tradeClientExtensions"] = _client_ext(strategy)
 
         return None
     
@@ -602,10 +739,12 @@ class LimitOrder(_BaseEntry):
     Methods
     -------
     `set()` : func
-        Sets required Limit Order specifications. 
+        Sets required Limit Order specifications.
 
     '''
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         ''' 
         
@@ -622,10 +761,7 @@ class LimitOrder(_BaseEntry):
         
         '''
 
-        _BaseEntry.__init__(self)
-
-        # set Market Order type
-        self.payload["type"] = "LIMIT"
+        _BaseEntry.__init__(self, "LIMIT")
 
         return None
 
@@ -715,20 +851,31 @@ class LimitOrder(_BaseEntry):
         '''
 
         
-        # set required specifications
-        self.payload["instrument"] = instrument
-        self.payload["units"] = units
-        self.payload["price"] = price
-        self.payload["timeInForce"] = timeInForce
-        
+        # reject bad enums locally before they cost a round-trip
+        if timeInForce not in _TIF:
+            raise ValueError("invalid timeInForce: {!r}".format(timeInForce))
+
+        if positionFill not in _POS_FILL:
+            raise ValueError("invalid positionFill: {!r}".format(positionFill))
+
+        if triggerCondition not in _TRIGGER:
+            raise ValueError("invalid triggerCondition: {!r}".format(triggerCondition))
+
+        # set required specifications - one bulk update off a single literal
+        self.payload.update({"instrument" : instrument,
+                             "units" : units,
+                             "price" : price,
+                             "timeInForce" : timeInForce,
+                             "positionFill" : positionFill,
+                             "triggerCondition" : triggerCondition})
+
         if (timeInForce == "GTD") and (gtdTime):
+            if isinstance(gtdTime, datetime.datetime):
+                gtdTime = _rfc3339(gtdTime)
             self.payload["gtdTime"] = gtdTime
 
-        self.payload["positionFill"] = positionFill
-        self.payload["triggerCondition"] = triggerCondition
-
         if strategy:
-            self.payload["clientExtensions"] = {"tag" : strategy}
+            self.payload["clientExtensions"] = _client_ext(strategy)
 
         return None
 
@@ -776,10 +923,12 @@ class StopOrder(_BaseEntry):
     Methods
     -------
     `set()` : func
-        Sets required Stop Order specifications. 
+        Sets required Stop Order specifications.
 
     '''
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         ''' 
         
@@ -796,10 +945,7 @@ class StopOrder(_BaseEntry):
         
         '''
 
-        _BaseEntry.__init__(self)
-
-        # set Market Order type
-        self.payload["type"] = "STOP"
+        _BaseEntry.__init__(self, "STOP")
 
         return None
 
@@ -894,24 +1040,35 @@ class StopOrder(_BaseEntry):
         '''
 
         
-        # set required specifications
-        self.payload["instrument"] = instrument
-        self.payload["units"] = units
-        self.payload["price"] = price
-        self.payload["timeInForce"] = timeInForce
-        
+        # reject bad enums locally before they cost a round-trip
+        if timeInForce not in _TIF:
+            raise ValueError("invalid timeInForce: {!r}".format(timeInForce))
+
+        if positionFill not in _POS_FILL:
+            raise ValueError("invalid positionFill: {!r}".format(positionFill))
+
+        if triggerCondition not in _TRIGGER:
+            raise ValueError("invalid triggerCondition: {!r}".format(triggerCondition))
+
+        # set required specifications - one bulk update off a single literal
+        self.payload.update({"instrument" : instrument,
+                             "units" : units,
+                             "price" : price,
+                             "timeInForce" : timeInForce,
+                             "positionFill" : positionFill,
+                             "triggerCondition" : triggerCondition})
+
         if (timeInForce == "GTD") and (gtdTime):
+            if isinstance(gtdTime, datetime.datetime):
+                gtdTime = _rfc3339(gtdTime)
             self.payload["gtdTime"] = gtdTime
 
-        self.payload["positionFill"] = positionFill
-        self.payload["triggerCondition"] = triggerCondition
-
         # set optional specifications
         if priceBound:
             self.payload["priceBound"] = priceBound
 
         if strategy:
-            self.payload["clientExtensions"] = {"tag" : strategy}
+            self.payload["clientExtensions"] = _client_ext(strategy)
 
         return None
 
@@ -961,10 +1118,12 @@ class MarketIfTouchedOrder(_BaseEntry):
     Methods
     -------
     `set()` : func
-        Sets required MarketIfTouched Order specifications. 
+        Sets required MarketIfTouched Order specifications.
 
     '''
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         ''' 
         
@@ -981,10 +1140,7 @@ class MarketIfTouchedOrder(_BaseEntry):
         
         '''
 
-        _BaseEntry.__init__(self)
-
-        # set Market Order type
-        self.payload["type"] = "MARKET_IF_TOUCHED"
+        _BaseEntry.__init__(self, "MARKET_IF_TOUCHED")
 
         return None
 
@@ -1081,28 +1237,50 @@ class MarketIfTouchedOrder(_BaseEntry):
         '''
 
         
-        # set required specifications
-        self.payload["instrument"] = instrument
-        self.payload["units"] = units
-        self.payload["price"] = price
-        self.payload["timeInForce"] = timeInForce
-        
+        # reject bad enums locally before they cost a round-trip
+        if timeInForce not in _TIF:
+            raise ValueError("invalid timeInForce: {!r}".format(timeInForce))
+
+        if positionFill not in _POS_FILL:
+            raise ValueError("invalid positionFill: {!r}".format(positionFill))
+
+        if triggerCondition not in _TRIGGER:
+            raise ValueError("invalid triggerCondition: {!r}".format(triggerCondition))
+
+        # set required specifications - one bulk update off a single literal
+        self.payload.update({"instrument" : instrument,
+                             "units" : units,
+                             "price" : price,
+                             "timeInForce" : timeInForce,
+                             "positionFill" : positionFill,
+                             "triggerCondition" : triggerCondition})
+
         if (timeInForce == "GTD") and (gtdTime):
+            if isinstance(gtdTime, datetime.datetime):
+                gtdTime = _rfc3339(gtdTime)
             self.payload["gtdTime"] = gtdTime
 
-        self.payload["positionFill"] = positionFill
-        self.payload["triggerCondition"] = triggerCondition
-
         # set optional specifications
         if priceBound:
             self.payload["priceBound"] = priceBound
 
         if strategy:
-            self.payload["clientExtensions"] = {"tag" : strategy}
+            self.payload["clientExtensions"] = _client_ext(strategy)
 
         return None
 
 ''' SESSION '''
+# one server per session type
+_SERVERS = {"paper" : "https://api-fxpractice.oanda.com",
+            "live" : "https://api-fxtrade.oanda.com"}
+
+# headers shared by every session - only "Authorization" varies
+_STATIC_HEADERS = {"Content-Type" : "application/json",
+                   "AcceptDatetimeFormat" : "RFC3339"}
+
+# currencies that carry a daily ANNUALIZED "admin" rate
+_ADMIN_CURRS = frozenset(("TRY", "CZK", "HUF", "SAR", "THB", "ZAR"))
+
 class FastOanda():
     '''
     
@@ -1221,6 +1399,9 @@ class FastOanda():
     `place()` : func
         Places an BASE order.
 
+    `place_many()` : func
+        Places multiple BASE orders concurrently.
+
     `get_orders()` : func
         Returns order confirmations for a given instrument for any order
         placed within the session.
@@ -1261,7 +1442,14 @@ class FastOanda():
 
     '''
 
-    def __init__(self, 
+    __slots__ = ("_accountID", "_token", "_server", "_accountBase",
+                 "_headers", "_session",
+                 "_httpLag", "_accountResponse", "_account", "_tradesResponse",
+                 "_trades", "_conversionsResponse", "_conversions",
+                 "_autopolling", "_targetCache", "_pollingLock", "_updateLock",
+                 "_orderLock", "_isTrading", "_pairs")
+
+    def __init__(self,
                  sessionType : str, 
                  accountID : str, 
                  token : str, 
@@ -1299,22 +1487,33 @@ class FastOanda():
         self._accountID = accountID
         self._token = "Bearer {}".format(token)
 
-        # point at correct server
-        if sessionType == "paper":
-            self._server = "https://api-fxpractice.oanda.com"
+        # point at correct server - fail fast on typos rather than leaving
+        # the session half-built
+        try:
+            self._server = _SERVERS[sessionType]
+
+        except KeyError:
+            raise ValueError("sessionType must be 'paper' or 'live', got {!r}".format(sessionType))
 
-        elif sessionType == "live":
-            self._server = "https://api-fxtrade.oanda.com"
+        # precompute the account-scoped URL root - every account endpoint
+        # hangs off of it, so hot paths only pay for one short concatenation
+        self._accountBase = self._server + "/v3/accounts/" + self._accountID
 
         # set mandatory headers
-        self._headers = {"Authorization" : self._token, 
-                         "Content-Type" : "application/json",
-                         "AcceptDatetimeFormat" : "RFC3339"}
+        self._headers = {**_STATIC_HEADERS, "Authorization" : self._token}
 
         # build session (mandatory headers included in all request from here on out)
         self._session = requests.Session()
         self._session.headers.update(self._headers)
 
+        # widen the connection pool so the background polling thread and
+        # order placement never queue behind each other for a pooled
+        # connection (requests defaults to 10 and silently discards
+        # overflow connections, forcing fresh TLS handshakes)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4,
+                                                pool_maxsize=32)
+        self._session.mount("https://", adapter)
+
         # http timing details
         self._httpLag = datetime.timedelta(seconds=.1)
 
@@ -1342,34 +1541,34 @@ class FastOanda():
 
         ''' SESSION BEGIN '''
         # pull available instruments
-        url = self._server + "/v3/accounts/{}/instruments".format(self._accountID)
+        url = self._accountBase + "/instruments"
         pairsResponse = self._session.get(url=url)
 
         # don't begin session without instrument details
         pairsResponse.raise_for_status()
         self._pairs = {}
         
-        for pair in pairsResponse.json(object_hook=to_objects)["instruments"]:
+        for pair in from_json(pairsResponse.content)["instruments"]:
             # get APR swap rates
-            self._pairs[pair["name"]] = {"precision" : pair["displayPrecision"], 
-                                         "marginRate" : pair["marginRate"],
-                                         "longSwap" : pair["financing"]["longRate"],
-                                         "shortSwap" : pair["financing"]["shortRate"]}
+            details = {"precision" : pair["displayPrecision"],
+                       "marginRate" : pair["marginRate"],
+                       "longSwap" : pair["financing"]["longRate"],
+                       "shortSwap" : pair["financing"]["shortRate"]}
 
-            # get daily ANNUALIZED "admin" rates:
+            # get daily ANNUALIZED "admin" rates - one frozenset membership
+            # test against the module-level currency table
             baseCurr, quoteCurr = pair["name"].split("_")
-            adminFees = {"TRY" : .04, "CZK" : .02, "HUF" : .02,
-                         "SAR" : .02, "THB" : .02, "ZAR" : .02}
 
             if baseCurr == "TRY" or quoteCurr == "TRY":
-                self._pairs[pair["name"]]["adminFee"] = .02
+                details["adminFee"] = .02
+
+            elif baseCurr in _ADMIN_CURRS or quoteCurr in _ADMIN_CURRS:
+                details["adminFee"] = .04
 
-            elif (baseCurr in adminFees.keys()) or (quoteCurr in adminFees.keys()):
-                self._pairs[pair["name"]]["adminFee"] = .04
-            
             else:
-                self._pairs[pair["name"]]["adminFee"] = .01
+                details["adminFee"] = .01
 
+            self._pairs[pair["name"]] = details
 
         return None
 
@@ -1405,23 +1604,23 @@ class FastOanda():
         with self._pollingLock:
 
             # (1) pull account details
-            url = self._server + "/v3/accounts/{}".format(self._accountID)
+            url = self._accountBase
             self._accountResponse = self._session.get(url=url)
             
             try:
                 self._accountResponse.raise_for_status()
-                self._account = self._accountResponse.json(object_hook=to_objects)
+                self._account = from_json(self._accountResponse.content)
 
             except:
                 self._account = False
 
             # (2) pull trade details
-            url = self._server + "/v3/accounts/{}/openTrades".format(self._accountID)
+            url = self._accountBase + "/openTrades"
             self._tradesResponse = self._session.get(url=url)
 
             try:
                 self._tradesResponse.raise_for_status()
-                self._trades = self._tradesResponse.json(object_hook=to_objects)
+                self._trades = from_json(self._tradesResponse.content)
 
             except:
                 self._trades = False
@@ -1433,14 +1632,14 @@ class FastOanda():
             if isinstance(targets, list):
                 targets = ",".join(targets)
 
-            url = self._server + "/v3/accounts/{}/pricing".format(self._accountID)
+            url = self._accountBase + "/pricing"
             self._conversionsResponse = self._session.get(url=url,
                                                           params={"instruments" : targets,
                                                                   "includeHomeConversions" : True})
 
             try:
                 self._conversionsResponse.raise_for_status()
-                self._conversions = self._conversionsResponse.json(object_hook=to_objects)
+                self._conversions = from_json(self._conversionsResponse.content)
             
             except:
                 self._conversions = False
@@ -1612,7 +1811,7 @@ class FastOanda():
 
         try:
             candlesResponse.raise_for_status()
-            candles = candlesResponse.json(object_hook=to_objects)
+            candles = from_json(candlesResponse.content)
 
             # will contain mid / bid / ask / spread(s)
             mids = []
@@ -1694,15 +1893,50 @@ class FastOanda():
         orderSpecs = order.get_payload()
 
         # place the order
-        url = self._server + "/v3/accounts/{}/orders".format(self._accountID)
+        url = self._accountBase + "/orders"
         orderResponse = self._session.post(url=url,
-                                           json=to_strings({"order" : orderSpecs}))
+                                           data=orjson.dumps(to_strings({"order" : orderSpecs})))
 
         # record responses
-        orderConfirmation = orderResponse.json(object_hook=to_objects)
-            
+        orderConfirmation = from_json(orderResponse.content)
+
         return orderConfirmation
 
+    def place_many(self, orders : list) -> list:
+        '''
+
+        Places multiple BASE orders concurrently. Requests are dispatched in
+        parallel over the session's connection pool, so total wall-clock is
+        roughly one round-trip rather than one per order. *Note* OANDA's v20
+        API has no batch endpoint - each order is still an individual request
+        and consumes its own rate-limit token.
+
+
+        Parameters
+        ----------
+        `orders` : list
+            Any base orders with configured settings:
+                - MarketOrder()
+                - LimitOrder()
+                - StopOrder()
+                - MarketIfTouchedOrder()
+
+        Returns
+        -------
+        `list`
+            The orders' confirmation details, in the order provided.
+
+        '''
+
+        if not orders:
+            return []
+
+        # one worker per order, capped at the connection pool's size
+        with ThreadPoolExecutor(max_workers=min(len(orders), 32)) as executor:
+            confirmations = list(executor.map(self.place, orders))
+
+        return confirmations
+
     def close(self, 
               targets : list | str | None = None,
               cutBy : float | None = None,
@@ -1799,17 +2033,17 @@ class FastOanda():
                 else:
 
                     # set target
-                    url = self._server + "/v3/accounts/{}/positions/{}/close".format(self._accountID, target)
+                    url = self._accountBase + "/positions/{}/close".format(target)
                     
                     # load payload
                     data = {"longUnits" : longUnits,
                             "shortUnits" : shortUnits}        
 
                     # close position
-                    orderResponse = self._session.put(url=url, json=to_strings(data))
+                    orderResponse = self._session.put(url=url, data=orjson.dumps(to_strings(data)))
                     
                     # record responses
-                    orderConfirmation = orderResponse.json(object_hook=to_objects)                
+                    orderConfirmation = from_json(orderResponse.content)                
                     confirmations.append(orderConfirmation)
 
         if len(confirmations) == 1:
@@ -4,9 +4,14 @@ import asyncio
 import threading
 import datetime
 import json
-import copy
+import re
 import pandas as pd
 
+# numeric / RCF3339 string shapes, matched up front so the common
+# non-numeric case never raises (exception unwinding is expensive)
+_NUM_RE = re.compile(r"^-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?$")
+_TS_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T")
+
 class Stream():
     '''
     
@@ -336,66 +341,55 @@ class OALink():
         if isinstance(iterable, dict):
             
             for key in iterable.keys():
+                item = iterable[key]
 
-                # convert strings
-                if isinstance(iterable[key], str):
-                    
-                    # likely a float or RCF3339 time if string contains "."
-                    if "." in iterable[key]:
-                        # more often than not it's a float
-                        try: 
-                            iterable[key] = float(iterable[key])
-                        except:
-                            # could also be RCF3339 time
-                            try:
-                                iterable[key] = datetime.datetime.fromisoformat(iterable[key])
-                            
-                            # if neither, should remain a string
-                            except:
-                                pass
-                    
-                    # otherwise, try convert to integer
-                    else:
-                        try: 
-                            iterable[key] = int(iterable[key])
-                        except:
+                # convert strings - the numeric regex guarantees the
+                # conversion succeeds, so no exceptions on the common path
+                if isinstance(item, str):
+
+                    if _NUM_RE.match(item):
+                        if "." in item or "e" in item or "E" in item:
+                            iterable[key] = float(item)
+                        else:
+                            iterable[key] = int(item)
+
+                    # otherwise typically RCF3339 time
+                    elif _TS_RE.match(item):
+                        try:
+                            iterable[key] = datetime.datetime.fromisoformat(item)
+                        # if neither, should remain a string
+                        except ValueError:
                             pass
-                
+
                 # recurse as needed
-                elif isinstance(iterable[key], (dict, list)):
-                    iterable[key] = self._to_objects(iterable[key])
+                elif isinstance(item, (dict, list)):
+                    iterable[key] = self._to_objects(item)
 
         # iterate over lists
         elif isinstance(iterable, list):
 
-            for item in iterable:
+            for i, item in enumerate(iterable):
 
                 # convert strings
                 if isinstance(item, str):
-                    
-                    # likely a float or RCF3339 time if string contains "."
-                    if "." in item:
-                        # more often than not, it's a float
-                        try: 
-                            item = float(item)
-                        except:
-                            # otherwise typically RCF3339 time
-                            try:
-                                item = datetime.datetime.fromisoformat(item)
-                            # if neither, should likely remain a string
-                            except:
-                                pass
-                    
-                    # try converting integers, as well
-                    else:
-                        try: 
-                            item = int(item)
-                        except:
+
+                    if _NUM_RE.match(item):
+                        if "." in item or "e" in item or "E" in item:
+                            iterable[i] = float(item)
+                        else:
+                            iterable[i] = int(item)
+
+                    # otherwise typically RCF3339 time
+                    elif _TS_RE.match(item):
+                        try:
+                            iterable[i] = datetime.datetime.fromisoformat(item)
+                        # if neither, should likely remain a string
+                        except ValueError:
                             pass
-                
+
                 # recurse as needed
                 elif isinstance(item, (dict, list)):
-                    item = self._to_objects(item)
+                    iterable[i] = self._to_objects(item)
 
         return iterable
 
@@ -485,15 +479,13 @@ class OALink():
 
         '''
 
-        # recurse down list
+        # recurse down list - rebuilt fresh, the original is never touched
         if isinstance(obj, list):
-            for entry in range(0, len(obj)):
-                obj[entry] = self._to_strings(obj[entry])
+            return [self._real_to_strings(entry) for entry in obj]
 
-        # recurse down dictionary
+        # recurse down dictionary - rebuilt fresh, the original is never touched
         elif isinstance(obj, dict):
-            for key in obj:
-                obj[key] = self._to_strings(obj[key])
+            return {key : self._real_to_strings(value) for key, value in obj.items()}
 
         # check if object is a datetime (and convert / format if it is)
         elif isinstance(obj, datetime.datetime):
@@ -525,9 +517,9 @@ class OALink():
 
         '''
 
-        newDict = copy.deepcopy(dictionary)
-
-        return self._real_to_strings(newDict)
+        # _real_to_strings() rebuilds containers as it walks, so no
+        # defensive deepcopy of the payload is needed
+        return self._real_to_strings(dictionary)
 
     def candles(self,
                     pair : str,